@@ -1074,8 +1074,7 @@ class ModernYouTube2SheetsGUI:
         
     def _open_settings(self):
         """Open settings dialog."""
-        settings_dialog = ModernSettingsDialog(self.root, self)
-        settings_dialog.focus()
+        ModernSettingsDialog.show(self.root, self)
         
     def _show_help(self):
         """Show help dialog."""
@@ -37,8 +37,8 @@ def demonstrate_gui_launch():
             'new_tab_frame', 'tab_name_dropdown', 'log_lines', 'MAX_LOG_LINES',
             'youtube_api_key_var', 'service_account_path_var', 'sheet_url_var',
             'tab_name_var', 'use_existing_tab_var', 'channel_textbox',
-            'min_duration_var', 'keyword_filter_var', 'keyword_mode_var',
-            'exclude_shorts_var', 'channel_var'
+            'min_duration_entry', 'keyword_filter_entry', 'keyword_mode_dropdown',
+            'exclude_shorts_var'
         ]
         
         missing = [comp for comp in critical_components if not hasattr(app, comp)]
@@ -356,47 +356,54 @@ class ModernIcon:
     Modern icon system with consistent styling.
     """
     
+    # Icon characters by name
+    ICONS = {
+        "play": "▶",
+        "pause": "⏸",
+        "stop": "⏹",
+        "settings": "⚙",
+        "refresh": "🔄",
+        "download": "⬇",
+        "upload": "⬆",
+        "check": "✓",
+        "cross": "✗",
+        "warning": "⚠",
+        "info": "ℹ",
+        "error": "❌",
+        "success": "✅",
+        "loading": "⏳",
+        "youtube": "📺",
+        "sheets": "📊",
+        "sync": "🔄",
+        "schedule": "⏰",
+        "filter": "🔍",
+        "export": "📤",
+        "import": "📥",
+        "edit": "✏",
+        "delete": "🗑",
+        "add": "➕",
+        "remove": "➖",
+        "up": "⬆",
+        "down": "⬇",
+        "left": "⬅",
+        "right": "➡",
+        "home": "🏠",
+        "back": "↩",
+        "forward": "↪",
+        "menu": "☰",
+        "close": "✕",
+        "minimize": "➖",
+        "maximize": "⬜",
+        "restore": "⤢"
+    }
+    
     @staticmethod
     def get_icon(icon_name: str, size: int = 24) -> str:
         """Get icon character for given name."""
-        icons = {
-            "play": "▶",
-            "pause": "⏸",
-            "stop": "⏹",
-            "settings": "⚙",
-            "refresh": "🔄",
-            "download": "⬇",
-            "upload": "⬆",
-            "check": "✓",
-            "cross": "✗",
-            "warning": "⚠",
-            "info": "ℹ",
-            "error": "❌",
-            "success": "✅",
-            "loading": "⏳",
-            "youtube": "📺",
-            "sheets": "📊",
-            "sync": "🔄",
-            "schedule": "⏰",
-            "filter": "🔍",
-            "export": "📤",
-            "import": "📥",
-            "edit": "✏",
-            "delete": "🗑",
-            "add": "➕",
-            "remove": "➖",
-            "up": "⬆",
-            "down": "⬇",
-            "left": "⬅",
-            "right": "➡",
-            "home": "🏠",
-            "back": "↩",
-            "forward": "↪",
-            "menu": "☰",
-            "close": "✕",
-            "minimize": "➖",
-            "maximize": "⬜",
-            "restore": "⤢"
-        }
-        
-        return icons.get(icon_name, "?")
+        return ModernIcon.ICONS.get(icon_name, "?")
+
+
+# Icons resolved once at import for hot build paths
+ICON_CLOSE = ModernIcon.ICONS["close"]
+ICON_CROSS = ModernIcon.ICONS["cross"]
+ICON_CHECK = ModernIcon.ICONS["check"]
@@ -5,8 +5,10 @@ Designed by the Front End Architect & Designer
 
 from __future__ import annotations
 
+import tkinter as tk
+import weakref
 import customtkinter as ctk
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -124,6 +126,23 @@ class Spacing:
     shadow_xl: str = "0 20px 25px rgba(0,0,0,0.1)"
 
 
+class _StyleVariants:
+    """Style dicts by variant as attributes, e.g. ``theme.button.ghost``.
+    
+    Each access returns a fresh copy from the theme's style cache, so
+    callers may merge into it.
+    """
+    
+    def __init__(self, get_style: Callable[[str], Dict[str, Any]], variants: Tuple[str, ...]):
+        self._get_style = get_style
+        self._variants = frozenset(variants)
+        
+    def __getattr__(self, variant: str) -> Dict[str, Any]:
+        if variant not in self._variants:
+            raise AttributeError(variant)
+        return self._get_style(variant)
+
+
 class ModernTheme:
     """Modern theme system for YouTube2Sheets."""
     
@@ -136,6 +155,19 @@ class ModernTheme:
         self.is_dark = True
         self.current_theme = "dark"
         
+        # Built styles keyed by kind (every variant is built at once), valid
+        # for one theme and one Tk root: their CTkFonts belong to the root
+        # they were made under
+        self._style_cache: Dict[str, Any] = {}
+        self._style_theme = self.current_theme
+        self._style_root: Optional[weakref.ref] = None
+        
+        # Attribute-style lookups, built once; they read through the cache
+        self.text = _StyleVariants(self.get_text_style, ("heading", "subheading", "body", "caption", "small"))
+        self.button = _StyleVariants(
+            self.get_button_style, ("primary", "secondary", "success", "warning", "error", "ghost")
+        )
+        
     def apply_theme(self, root: ctk.CTk):
         """Apply the modern theme to the application."""
         # Set appearance mode
@@ -145,9 +177,36 @@ class ModernTheme:
         # Configure root window
         root.configure(fg_color=self.colors.background)
         
+    def clear_style_cache(self):
+        """Drop built style dicts so they are rebuilt from current colors."""
+        self._style_cache.clear()
+        
+    def _cached_styles(self, kind: str, build: Callable[[], Any]) -> Any:
+        """Return the styles built for ``kind``, building them for the current theme and root if needed."""
+        root = getattr(tk, "_default_root", None)
+        cached_root = self._style_root() if self._style_root is not None else None
+        if self._style_theme != self.current_theme or cached_root is not root:
+            self._style_cache.clear()
+            self._style_theme = self.current_theme
+            self._style_root = weakref.ref(root) if root is not None else None
+        styles = self._style_cache.get(kind)
+        if styles is None:
+            styles = self._style_cache[kind] = build()
+        return styles
+        
+    @property
+    def input_(self) -> Dict[str, Any]:
+        """Input field style."""
+        return self.get_input_style()
+        
     def get_button_style(self, variant: str = "primary") -> Dict[str, Any]:
         """Get button styling for different variants."""
-        styles = {
+        styles = self._cached_styles("button", self._build_button_styles)
+        # Callers may merge into the result; the cached dict stays untouched
+        return dict(styles.get(variant, styles["primary"]))
+        
+    def _build_button_styles(self) -> Dict[str, Dict[str, Any]]:
+        return {
             "primary": {
                 "fg_color": self.colors.primary,
                 "hover_color": self.colors.primary_dark,
@@ -197,10 +256,12 @@ class ModernTheme:
                 "height": 44,
             }
         }
-        return styles.get(variant, styles["primary"])
         
     def get_input_style(self) -> Dict[str, Any]:
         """Get input field styling."""
+        return dict(self._cached_styles("input", self._build_input_style))
+        
+    def _build_input_style(self) -> Dict[str, Any]:
         return {
             "fg_color": self.colors.surface,
             "border_color": self.colors.border,
@@ -231,7 +292,11 @@ class ModernTheme:
         
     def get_text_style(self, variant: str = "body") -> Dict[str, Any]:
         """Get text styling for different variants."""
-        styles = {
+        styles = self._cached_styles("text", self._build_text_styles)
+        return dict(styles.get(variant, styles["body"]))
+        
+    def _build_text_styles(self) -> Dict[str, Dict[str, Any]]:
+        return {
             "heading": {
                 "font": ctk.CTkFont(size=self.typography.font_size_3xl, weight=self.typography.font_weight_bold),
                 "text_color": self.colors.text_primary,
@@ -253,7 +318,6 @@ class ModernTheme:
                 "text_color": self.colors.text_tertiary,
             }
         }
-        return styles.get(variant, styles["body"])
         
     def toggle_theme(self):
         """Toggle between dark and light themes."""
@@ -277,6 +341,8 @@ class ModernTheme:
             self.colors.text_primary = "#FFFFFF"
             self.colors.text_secondary = "#EBEBF5"
             self.colors.border = "#38383A"
+            
+        self.clear_style_cache()
 
 
 # Global theme instance
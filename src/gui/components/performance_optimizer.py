@@ -5,15 +5,54 @@ Designed by the Back End Architect & Performance Engineer
 
 from __future__ import annotations
 
+import gc
+import os
 import threading
 import time
 import queue
 import math
-from typing import Callable, Any, Optional, Dict
+from collections import deque
+from typing import Callable, Any, Optional, Dict, List, NamedTuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
 import customtkinter as ctk
 
+try:
+    import psutil
+except ImportError:
+    # psutil is optional; system metrics are simply not collected without it
+    psutil = None
+
+
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Easing functions keyed by name; resolved once per animation, not per frame
+_EASING: Dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease_in_out": lambda t: 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t),
+    "ease_out_cubic": lambda t: 1 - (1 - t) * (1 - t) * (1 - t),
+    "ease_in_cubic": lambda t: t * t * t,
+    "ease_in_out_cubic": lambda t: 4 * t * t * t if t < 0.5 else 1 - 4 * (1 - t) * (1 - t) * (1 - t),
+    "ease_out_quart": lambda t: 1 - (1 - t) * (1 - t) * (1 - t) * (1 - t),
+    "ease_in_quart": lambda t: t * t * t * t,
+    "ease_in_out_quart": lambda t: 8 * t * t * t * t if t < 0.5 else 1 - 8 * (1 - t) * (1 - t) * (1 - t) * (1 - t),
+    "ease_out_expo": lambda t: 1 - (2 ** (-10 * t)) if t < 1 else 1,
+    "ease_in_expo": lambda t: 2 ** (10 * (t - 1)) if t > 0 else 0,
+    "ease_in_out_expo": lambda t: 2 ** (10 * (2 * t - 1)) / 2 if t < 0.5 else (2 - 2 ** (-10 * (2 * t - 1))) / 2,
+    "ease_out_back": lambda t: 1 + 2.7 * (t - 1) ** 3 + 1.7 * (t - 1) ** 2,
+    "ease_in_back": lambda t: 2.7 * t ** 3 - 1.7 * t ** 2,
+    "ease_in_out_back": lambda t: 1.7 * t * t * (2.7 * t - 1.7) if t < 0.5 else 1 + 1.7 * (t - 1) * (t - 1) * (2.7 * (t - 1) + 1.7),
+    "ease_out_elastic": lambda t: 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) + 1 if t > 0 else 0,
+    "ease_in_elastic": lambda t: 2 ** (10 * (t - 1)) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) if t > 0 else 0,
+    "ease_in_out_elastic": lambda t: 2 ** (10 * (2 * t - 1)) * math.sin((2 * t * 10 - 0.75) * (2 * math.pi) / 3) / 2 if t < 0.5 else (2 - 2 ** (-10 * (2 * t - 1)) * math.sin((2 * t * 10 - 0.75) * (2 * math.pi) / 3)) / 2,
+    "ease_out_bounce": lambda t: 1 - (1 - t) ** 4 if t < 0.75 else 1 - (1 - t) ** 2 if t < 0.875 else 1 - (1 - t) ** 1.5,
+    "ease_in_bounce": lambda t: t ** 4 if t < 0.25 else t ** 2 if t < 0.375 else t ** 1.5,
+    "ease_in_out_bounce": lambda t: 2 * t ** 4 if t < 0.25 else 2 * t ** 2 if t < 0.375 else 2 * t ** 1.5 if t < 0.5 else 2 - 2 * (1 - t) ** 4 if t < 0.75 else 2 - 2 * (1 - t) ** 2 if t < 0.875 else 2 - 2 * (1 - t) ** 1.5,
+}
+
 
 @dataclass
 class PerformanceMetrics:
@@ -30,13 +69,29 @@ class PerformanceMonitor:
     Real-time performance monitoring and optimization.
     """
     
-    def __init__(self, root: ctk.CTk):
+    def __init__(
+        self,
+        root: ctk.CTk,
+        polling_interval: float = 0.25,
+        system_metrics_hz: float = 2.0
+    ):
+        if system_metrics_hz <= 0:
+            raise ValueError(f"system_metrics_hz must be positive, got {system_metrics_hz}")
         self.root = root
         self.metrics = PerformanceMetrics()
         self.is_monitoring = False
         self.monitor_thread = None
-        self.frame_times = []
-        self.max_frame_samples = 60  # 1 second at 60 FPS
+        self._stop_evt = threading.Event()
+        # How often the loop wakes to check whether a sample is due
+        self._monitor_interval = polling_interval
+        
+        # Metrics are sampled and thresholds checked at most every
+        # _sample_interval seconds, with or without psutil
+        self._proc = psutil.Process() if psutil else None
+        if self._proc is not None:
+            self._proc.cpu_percent(None)  # Prime: the first reading is always 0.0
+        self._last_sample_ts = 0.0
+        self._sample_interval = 1.0 / system_metrics_hz
         
         # Performance thresholds
         self.target_fps = 60
@@ -44,62 +99,100 @@ class PerformanceMonitor:
         self.max_memory_mb = 500
         self.max_cpu_percent = 80
         
+        # Frame times are measured on the Tk thread by an after() tick at
+        # target_fps; a busy event loop delays the tick, lowering frame_rate
+        self._frame_interval_ms = max(1, round(1000 / self.target_fps))
+        self._frame_times: deque = deque(maxlen=self.target_fps)
+        self._frame_total = 0.0
+        self._last_frame_ts = 0.0
+        self._frame_after = None
+        
     def start_monitoring(self):
         """Start performance monitoring."""
         if self.is_monitoring:
             return
             
         self.is_monitoring = True
+        self._stop_evt.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         
+        self._last_frame_ts = time.monotonic()
+        self._frame_after = self.root.after(self._frame_interval_ms, self._frame_tick)
+        
     def stop_monitoring(self):
         """Stop performance monitoring."""
         self.is_monitoring = False
+        self._stop_evt.set()
+        if self._frame_after is not None:
+            self.root.after_cancel(self._frame_after)
+            self._frame_after = None
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
             
     def _monitor_loop(self):
         """Main monitoring loop."""
+        interval = self._monitor_interval
+        next_tick = time.monotonic() + interval
         while self.is_monitoring:
-            try:
-                # Measure frame time
-                start_time = time.time()
-                
-                # Update metrics
-                self._update_metrics()
-                
-                # Check performance thresholds
-                self._check_performance_thresholds()
-                
-                # Calculate frame rate
-                frame_time = time.time() - start_time
-                self.frame_times.append(frame_time)
-                
-                if len(self.frame_times) > self.max_frame_samples:
-                    self.frame_times.pop(0)
-                    
-                if self.frame_times:
-                    self.metrics.frame_rate = 1.0 / (sum(self.frame_times) / len(self.frame_times))
+            # System metrics run at system_metrics_hz, not every tick
+            now = time.monotonic()
+            if now - self._last_sample_ts >= self._sample_interval:
+                self._last_sample_ts = now
+                try:
+                    self._update_metrics()
+                    self._check_performance_thresholds()
+                except Exception as e:
+                    # A failed sample must not stop the monitor
+                    print(f"Error sampling performance metrics: {e}")
                     
-                time.sleep(0.016)  # ~60 FPS monitoring
-                
-            except Exception:
+            # Wait against an absolute schedule so jitter does not accumulate;
+            # stop_monitoring() wakes the wait immediately
+            if self._stop_evt.wait(max(0.0, next_tick - time.monotonic())):
                 break
+            next_tick += interval
+            now = time.monotonic()
+            if next_tick < now:
+                # Fell behind: skip missed ticks instead of bursting
+                next_tick = now + interval
                 
+    def _frame_tick(self):
+        """Record the time since the last tick as one frame time (runs on the Tk thread)."""
+        if not self.is_monitoring:
+            return
+        now = time.monotonic()
+        frame_time = now - self._last_frame_ts
+        self._last_frame_ts = now
+        
+        # Running total over the window, so each tick is O(1)
+        times = self._frame_times
+        if len(times) == times.maxlen:
+            self._frame_total -= times[0]
+        times.append(frame_time)
+        self._frame_total += frame_time
+        if self._frame_total > 0:
+            # One float store; the monitor thread only reads it
+            self.metrics.frame_rate = len(times) / self._frame_total
+            
+        self._frame_after = self.root.after(self._frame_interval_ms, self._frame_tick)
+        
     def _update_metrics(self):
         """Update performance metrics."""
-        # Memory usage (simplified)
-        import psutil
-        process = psutil.Process()
-        self.metrics.memory_usage = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # CPU usage
-        self.metrics.cpu_usage = process.cpu_percent()
+        # psutil is optional; without it there are no system metrics
+        if self._proc is None:
+            return
+            
+        with self._proc.oneshot():
+            # Memory usage (simplified)
+            self.metrics.memory_usage = self._proc.memory_info().rss * _BYTES_TO_MB
+            
+            # CPU usage
+            self.metrics.cpu_usage = self._proc.cpu_percent(interval=None)
         
     def _check_performance_thresholds(self):
         """Check if performance is below thresholds."""
-        if self.metrics.frame_rate < self.min_fps:
+        # frame_rate is 0.0 until the first frame tick
+        if 0.0 < self.metrics.frame_rate < self.min_fps:
             self._optimize_performance()
             
         if self.metrics.memory_usage > self.max_memory_mb:
@@ -120,7 +213,6 @@ class PerformanceMonitor:
         # Clear caches
         # Reduce buffer sizes
         # Garbage collect
-        import gc
         gc.collect()
         
     def _optimize_cpu(self):
@@ -131,15 +223,33 @@ class PerformanceMonitor:
         pass
 
 
+class _TaskEntry(NamedTuple):
+    """State for one submitted task."""
+    future: Future
+    callback: Optional[Callable]
+
+
 class AsyncTaskManager:
     """
     Asynchronous task management for non-blocking UI operations.
     """
     
-    def __init__(self, max_workers: int = 4):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.tasks: Dict[str, Future] = {}
-        self.callbacks: Dict[str, Callable] = {}
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        ui_queue: Optional[UIUpdateQueue] = None
+    ):
+        # Tasks are mostly I/O-bound API calls, so size well above core count
+        max_workers = max_workers or min(32, (os.cpu_count() or 4) * 4)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="yt2s-async"
+        )
+        self._tasks: Dict[str, _TaskEntry] = {}
+        self._lock = threading.Lock()
+        
+        # When set, completion callbacks run on the Tk thread via this queue
+        self._ui_queue = ui_queue
         
     def submit_task(
         self,
@@ -151,46 +261,52 @@ class AsyncTaskManager:
     ) -> Future:
         """Submit an asynchronous task."""
         # Cancel existing task with same ID
-        if task_id in self.tasks:
-            self.cancel_task(task_id)
+        with self._lock:
+            previous = self._tasks.pop(task_id, None)
+        if previous:
+            previous.future.cancel()
             
         # Submit new task
         future = self.executor.submit(func, *args, **kwargs)
-        self.tasks[task_id] = future
-        
-        if callback:
-            self.callbacks[task_id] = callback
+        with self._lock:
+            self._tasks[task_id] = _TaskEntry(future, callback)
             
         # Set up completion handling
-        future.add_done_callback(lambda f: self._on_task_complete(task_id, f))
+        future.add_done_callback(partial(self._on_task_complete, task_id))
         
         return future
         
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a running task."""
-        if task_id in self.tasks:
-            future = self.tasks[task_id]
-            cancelled = future.cancel()
-            if cancelled:
-                del self.tasks[task_id]
-                if task_id in self.callbacks:
-                    del self.callbacks[task_id]
-            return cancelled
-        return False
+        with self._lock:
+            entry = self._tasks.get(task_id)
+        if entry is None:
+            return False
+        cancelled = entry.future.cancel()
+        if cancelled:
+            with self._lock:
+                if self._tasks.get(task_id) is entry:
+                    del self._tasks[task_id]
+        return cancelled
         
     def _on_task_complete(self, task_id: str, future: Future):
         """Handle task completion."""
-        if task_id in self.callbacks:
+        with self._lock:
+            entry = self._tasks.get(task_id)
+            if entry is None or entry.future is not future:
+                # Superseded by a newer task with the same ID
+                return
+            del self._tasks[task_id]
+            
+        if entry.callback:
             try:
-                result = future.result()
-                self.callbacks[task_id](result)
+                args = (future.result(),)
             except Exception as e:
-                self.callbacks[task_id](None, e)
-            finally:
-                del self.callbacks[task_id]
-                
-        if task_id in self.tasks:
-            del self.tasks[task_id]
+                args = (None, e)
+            if self._ui_queue is not None:
+                self._ui_queue.schedule_update(entry.callback, *args)
+            else:
+                entry.callback(*args)
             
     def shutdown(self, wait: bool = True):
         """Shutdown the task manager."""
@@ -204,43 +320,38 @@ class UIUpdateQueue:
     
     def __init__(self, root: ctk.CTk):
         self.root = root
-        self.update_queue = queue.Queue()
-        self.is_processing = False
-        self.max_updates_per_frame = 10
+        self.update_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.frame_budget = 0.008  # Half a 60 FPS frame per drain
+        
+        # The drainer runs on the Tk thread; producers never touch Tk
+        self._drain_id = self.root.after(16, self._drain)
         
     def schedule_update(self, func: Callable, *args, **kwargs):
-        """Schedule a UI update."""
+        """Schedule a UI update. Safe to call from any thread."""
         self.update_queue.put((func, args, kwargs))
-        if not self.is_processing:
-            self._process_updates()
             
-    def _process_updates(self):
-        """Process queued UI updates."""
-        if self.is_processing:
-            return
-            
-        self.is_processing = True
-        
-        def process():
-            updates_processed = 0
-            while not self.update_queue.empty() and updates_processed < self.max_updates_per_frame:
-                try:
-                    func, args, kwargs = self.update_queue.get_nowait()
-                    func(*args, **kwargs)
-                    updates_processed += 1
-                except queue.Empty:
-                    break
-                except Exception as e:
-                    print(f"Error processing UI update: {e}")
-                    
-            self.is_processing = False
-            
-            # Schedule next batch if queue is not empty
-            if not self.update_queue.empty():
-                self.root.after(16, self._process_updates)  # ~60 FPS
+    def _drain(self):
+        """Process queued UI updates within the frame budget."""
+        start = time.monotonic()
+        while True:
+            try:
+                func, args, kwargs = self.update_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                print(f"Error processing UI update: {e}")
+            if time.monotonic() - start > self.frame_budget:
+                break
                 
-        # Process updates in the main thread
-        self.root.after(0, process)
+        self._drain_id = self.root.after(16, self._drain)  # ~60 FPS
+        
+    def stop(self):
+        """Stop draining queued UI updates."""
+        if self._drain_id:
+            self.root.after_cancel(self._drain_id)
+            self._drain_id = None
 
 
 class SmoothAnimator:
@@ -250,9 +361,38 @@ class SmoothAnimator:
     
     def __init__(self, root: ctk.CTk):
         self.root = root
-        self.animations: Dict[str, Dict] = {}
         self.animation_id = None
         
+        # Structure-of-arrays animation state: index i across every column
+        # describes one running animation
+        self._ids: List[str] = []
+        self._widgets: List[Any] = []
+        self._props: List[str] = []
+        self._starts: List[Any] = []
+        self._ends: List[Any] = []
+        self._t0: List[float] = []
+        self._dur: List[float] = []
+        self._ease: List[Callable[[float], float]] = []
+        self._callbacks: List[Optional[Callable]] = []
+        # Whether each property is a configure() option (else a plain attribute)
+        self._options: List[bool] = []
+        
+        # Non-numeric properties cannot be interpolated; they snap to their
+        # end value via a single after() instead of ticking every frame
+        self._snaps: Dict[str, str] = {}
+        
+    def _columns(self) -> tuple:
+        """Return every per-animation column."""
+        return (
+            self._ids, self._widgets, self._props, self._starts, self._ends,
+            self._t0, self._dur, self._ease, self._callbacks, self._options
+        )
+        
+    def _remove_at(self, index: int):
+        """Remove the animation stored at index from every column."""
+        for column in self._columns():
+            del column[index]
+        
     def animate_property(
         self,
         widget,
@@ -267,23 +407,30 @@ class SmoothAnimator:
         animation_id = f"{id(widget)}_{property_name}"
         
         # Cancel existing animation
-        if animation_id in self.animations:
-            self._cancel_animation(animation_id)
-            
-        # Create animation
-        animation = {
-            "widget": widget,
-            "property": property_name,
-            "start_value": start_value,
-            "end_value": end_value,
-            "duration": duration,
-            "easing": easing,
-            "callback": callback,
-            "start_time": time.time(),
-            "current_value": start_value
-        }
+        self._cancel_animation(animation_id)
         
-        self.animations[animation_id] = animation
+        # Decided once per animation, so frames never probe with a failing call
+        is_option = self._is_option(widget, property_name)
+        
+        if not (isinstance(start_value, (int, float)) and isinstance(end_value, (int, float))):
+            self._set_property(widget, property_name, start_value, is_option)
+            self._snaps[animation_id] = self.root.after(
+                int(duration * 1000),
+                partial(self._snap, animation_id, widget, property_name, end_value, is_option, callback)
+            )
+            return
+            
+        # Create animation; easing is resolved once here
+        self._ids.append(animation_id)
+        self._widgets.append(widget)
+        self._props.append(property_name)
+        self._starts.append(start_value)
+        self._ends.append(end_value)
+        self._t0.append(time.monotonic())
+        self._dur.append(duration)
+        self._ease.append(_EASING.get(easing, _EASING["ease_out_cubic"]))
+        self._callbacks.append(callback)
+        self._options.append(is_option)
         
         # Start animation loop if not running
         if not self.animation_id:
@@ -291,89 +438,132 @@ class SmoothAnimator:
             
     def _animation_loop(self):
         """Main animation loop."""
-        if not self.animations:
+        count = len(self._ids)
+        if not count:
             self.animation_id = None
             return
             
-        current_time = time.time()
-        completed_animations = []
+        current_time = time.monotonic()
+        widgets, props = self._widgets, self._props
+        starts, ends = self._starts, self._ends
+        t0, dur, ease = self._t0, self._dur, self._ease
+        options = self._options
+        completed = []
         
-        for animation_id, animation in self.animations.items():
-            elapsed = current_time - animation["start_time"]
-            progress = min(elapsed / animation["duration"], 1.0)
-            
-            # Apply easing
-            eased_progress = self._apply_easing(progress, animation["easing"])
-            
+        # Writes are gathered per widget and applied once at the end of the frame
+        pending: Dict[int, Dict[str, Any]] = {}
+        widget_by_id: Dict[int, Any] = {}
+        
+        for i in range(count):
+            progress = (current_time - t0[i]) / dur[i]
+            if progress >= 1.0:
+                progress = 1.0
+                
             # Calculate current value
-            start_val = animation["start_value"]
-            end_val = animation["end_value"]
-            
-            if isinstance(start_val, (int, float)) and isinstance(end_val, (int, float)):
-                current_value = start_val + (end_val - start_val) * eased_progress
-            else:
-                current_value = end_val if progress >= 1.0 else start_val
+            start_val = starts[i]
+            current_value = start_val + (ends[i] - start_val) * ease[i](progress)
                 
-            # Apply to widget
-            try:
-                setattr(animation["widget"], animation["property"], current_value)
-                animation["current_value"] = current_value
-            except Exception as e:
-                print(f"Error animating {animation['property']}: {e}")
+            # Queue configure() options for this widget; plain attributes
+            # are set directly
+            widget = widgets[i]
+            if options[i]:
+                widget_id = id(widget)
+                if widget_id not in pending:
+                    pending[widget_id] = {}
+                    widget_by_id[widget_id] = widget
+                pending[widget_id][props[i]] = current_value
+            else:
+                self._set_property(widget, props[i], current_value, False)
                 
             # Check if animation is complete
             if progress >= 1.0:
-                completed_animations.append(animation_id)
-                if animation["callback"]:
-                    animation["callback"](current_value)
+                completed.append((i, current_value))
+                
+        # Apply to widgets: one call per touched widget per frame
+        for widget_id, values in pending.items():
+            self._apply(widget_by_id[widget_id], values)
                     
-        # Remove completed animations
-        for animation_id in completed_animations:
-            del self.animations[animation_id]
+        # Remove completed animations before running callbacks, which may
+        # start new animations
+        finished = []
+        for i, value in reversed(completed):
+            if self._callbacks[i]:
+                finished.append((self._callbacks[i], value))
+            self._remove_at(i)
+        for callback, value in reversed(finished):
+            callback(value)
             
         # Schedule next frame
-        if self.animations:
+        if self._ids:
             self.animation_id = self.root.after(16, self._animation_loop)  # ~60 FPS
         else:
             self.animation_id = None
             
     def _apply_easing(self, t: float, easing: str) -> float:
         """Apply easing function to animation progress."""
-        easing_functions = {
-            "linear": lambda t: t,
-            "ease_in": lambda t: t * t,
-            "ease_out": lambda t: 1 - (1 - t) * (1 - t),
-            "ease_in_out": lambda t: 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t),
-            "ease_out_cubic": lambda t: 1 - (1 - t) ** 3,
-            "ease_in_cubic": lambda t: t ** 3,
-            "ease_in_out_cubic": lambda t: 4 * t * t * t if t < 0.5 else 1 - 4 * (1 - t) ** 3,
-            "ease_out_quart": lambda t: 1 - (1 - t) ** 4,
-            "ease_in_quart": lambda t: t ** 4,
-            "ease_in_out_quart": lambda t: 8 * t * t * t * t if t < 0.5 else 1 - 8 * (1 - t) ** 4,
-            "ease_out_expo": lambda t: 1 - (2 ** (-10 * t)) if t < 1 else 1,
-            "ease_in_expo": lambda t: 2 ** (10 * (t - 1)) if t > 0 else 0,
-            "ease_in_out_expo": lambda t: 2 ** (10 * (2 * t - 1)) / 2 if t < 0.5 else (2 - 2 ** (-10 * (2 * t - 1))) / 2,
-            "ease_out_back": lambda t: 1 + 2.7 * (t - 1) ** 3 + 1.7 * (t - 1) ** 2,
-            "ease_in_back": lambda t: 2.7 * t ** 3 - 1.7 * t ** 2,
-            "ease_in_out_back": lambda t: 1.7 * t * t * (2.7 * t - 1.7) if t < 0.5 else 1 + 1.7 * (t - 1) * (t - 1) * (2.7 * (t - 1) + 1.7),
-            "ease_out_elastic": lambda t: 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) + 1 if t > 0 else 0,
-            "ease_in_elastic": lambda t: 2 ** (10 * (t - 1)) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) if t > 0 else 0,
-            "ease_in_out_elastic": lambda t: 2 ** (10 * (2 * t - 1)) * math.sin((2 * t * 10 - 0.75) * (2 * math.pi) / 3) / 2 if t < 0.5 else (2 - 2 ** (-10 * (2 * t - 1)) * math.sin((2 * t * 10 - 0.75) * (2 * math.pi) / 3)) / 2,
-            "ease_out_bounce": lambda t: 1 - (1 - t) ** 4 if t < 0.75 else 1 - (1 - t) ** 2 if t < 0.875 else 1 - (1 - t) ** 1.5,
-            "ease_in_bounce": lambda t: t ** 4 if t < 0.25 else t ** 2 if t < 0.375 else t ** 1.5,
-            "ease_in_out_bounce": lambda t: 2 * t ** 4 if t < 0.25 else 2 * t ** 2 if t < 0.375 else 2 * t ** 1.5 if t < 0.5 else 2 - 2 * (1 - t) ** 4 if t < 0.75 else 2 - 2 * (1 - t) ** 2 if t < 0.875 else 2 - 2 * (1 - t) ** 1.5,
-        }
+        return _EASING.get(easing, _EASING["ease_out_cubic"])(t)
         
-        return easing_functions.get(easing, easing_functions["ease_out_cubic"])(t)
+    @staticmethod
+    def _is_option(widget, property_name: str) -> bool:
+        """Return True if property_name is one of the widget's configure() options."""
+        cget = getattr(widget, "cget", None)
+        if cget is None:
+            return False
+        try:
+            cget(property_name)
+        except Exception:
+            return False
+        return True
         
+    def _apply(self, widget, values: Dict[str, Any]):
+        """Write animated configure() options to a widget in a single call."""
+        try:
+            widget.configure(**values)
+        except Exception:
+            # One rejected value must not drop the other properties' writes
+            for property_name, value in values.items():
+                self._set_property(widget, property_name, value, True)
+                
+    def _set_property(self, widget, property_name: str, value: Any, is_option: bool):
+        """Write one animated value as a configure() option or a plain attribute."""
+        try:
+            if is_option:
+                widget.configure(**{property_name: value})
+            else:
+                setattr(widget, property_name, value)
+        except Exception as e:
+            print(f"Error animating {property_name}: {e}")
+            
+    def _snap(
+        self,
+        animation_id: str,
+        widget,
+        property_name: str,
+        end_value: Any,
+        is_option: bool,
+        callback: Optional[Callable]
+    ):
+        """Finish a non-numeric animation by jumping to its end value."""
+        self._snaps.pop(animation_id, None)
+        self._set_property(widget, property_name, end_value, is_option)
+        if callback:
+            callback(end_value)
+            
     def _cancel_animation(self, animation_id: str):
         """Cancel a specific animation."""
-        if animation_id in self.animations:
-            del self.animations[animation_id]
+        if animation_id in self._ids:
+            self._remove_at(self._ids.index(animation_id))
+        snap_id = self._snaps.pop(animation_id, None)
+        if snap_id:
+            self.root.after_cancel(snap_id)
             
     def stop_all_animations(self):
         """Stop all running animations."""
-        self.animations.clear()
+        for column in self._columns():
+            column.clear()
+        for snap_id in self._snaps.values():
+            self.root.after_cancel(snap_id)
+        self._snaps.clear()
         if self.animation_id:
             self.root.after_cancel(self.animation_id)
             self.animation_id = None
@@ -395,6 +585,11 @@ class ResponsiveLayout:
         self.current_breakpoint = "desktop"
         self.layout_callbacks: Dict[str, Callable] = {}
         
+        # Trailing-edge debounce for <Configure> bursts during drag-resize
+        self.resize_debounce_ms = 100
+        self._resize_after = None
+        self._last_w = 0
+        
         # Bind resize events
         self.root.bind("<Configure>", self._on_resize)
         
@@ -407,8 +602,15 @@ class ResponsiveLayout:
         if event.widget != self.root:
             return
             
-        width = event.width
-        new_breakpoint = self._get_breakpoint(width)
+        self._last_w = event.width
+        if self._resize_after:
+            return
+        self._resize_after = self.root.after(self.resize_debounce_ms, self._flush_resize)
+        
+    def _flush_resize(self):
+        """Apply the latest window width once the resize burst settles."""
+        self._resize_after = None
+        new_breakpoint = self._get_breakpoint(self._last_w)
         
         if new_breakpoint != self.current_breakpoint:
             self.current_breakpoint = new_breakpoint
@@ -5,12 +5,73 @@ Responsive Progress Components with Real-time Updates and Smooth Animations
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Optional, Callable
+import weakref
+from typing import Optional, Callable, Set
 import customtkinter as ctk
-import threading
 import time
 
 
+class _GlobalAnimator:
+    """
+    Single per-toplevel ticker that drives every animating progress bar,
+    so one after() event is scheduled per frame regardless of bar count.
+    """
+    
+    # Weak on both sides so a destroyed toplevel and its animator can be freed
+    _instances: "weakref.WeakKeyDictionary[tk.Misc, _GlobalAnimator]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, toplevel: tk.Misc, interval: int):
+        self._toplevel_ref = weakref.ref(toplevel)
+        self._interval = interval
+        self._bars: Set["ResponsiveProgressBar"] = set()
+        self._after_id = None
+        
+    @classmethod
+    def get(cls, bar: "ResponsiveProgressBar") -> "_GlobalAnimator":
+        """Return the shared animator for the bar's toplevel window."""
+        toplevel = bar.winfo_toplevel()
+        animator = cls._instances.get(toplevel)
+        if animator is None:
+            animator = cls(toplevel, bar.update_interval)
+            cls._instances[toplevel] = animator
+        return animator
+        
+    def register(self, bar: "ResponsiveProgressBar"):
+        """Start driving a bar's animation."""
+        self._bars.add(bar)
+        toplevel = self._toplevel_ref()
+        if self._after_id is None and toplevel is not None:
+            self._after_id = toplevel.after(self._interval, self._tick)
+            
+    def unregister(self, bar: "ResponsiveProgressBar"):
+        """Stop driving a bar's animation."""
+        self._bars.discard(bar)
+        
+    def _tick(self):
+        """Advance every registered bar by one frame."""
+        self._after_id = None
+        for bar in list(self._bars):
+            try:
+                still_animating = bar._animate_progress()
+            except tk.TclError:
+                # Bar was destroyed mid-animation
+                still_animating = False
+            if not still_animating:
+                self._bars.discard(bar)
+                
+        if self._bars:
+            toplevel = self._toplevel_ref()
+            try:
+                if toplevel is None:
+                    raise tk.TclError("toplevel was garbage collected")
+                self._after_id = toplevel.after(self._interval, self._tick)
+            except tk.TclError:
+                # Toplevel was destroyed; drop the animator entirely
+                self._bars.clear()
+                if toplevel is not None:
+                    self._instances.pop(toplevel, None)
+
+
 class ResponsiveProgressBar(ctk.CTkProgressBar):
     """
     Enhanced progress bar with smooth animations and real-time updates.
@@ -28,65 +89,98 @@ class ResponsiveProgressBar(ctk.CTkProgressBar):
         self.animation_duration = animation_duration
         self.update_interval = update_interval
         
-        # Animation state
-        self._target_value = 0.0
-        self._current_value = 0.0
-        self._animation_id = None
+        # Animation state, starting from the value CTkProgressBar drew
+        # initially (0.5 by default), not from 0
+        self._target_value = self.get()
+        self._current_value = self._target_value
         self._is_animating = False
         
         # Smooth animation
         self._start_time = 0
         self._start_value = 0.0
         
+        # Last value/pixel actually drawn, to skip redraws that change nothing
+        self._last_drawn = -1.0
+        self._last_drawn_px = -1
+        
+        # Drawn width in pixels, kept current from <Configure> so animation
+        # frames don't query Tk for it; 0 until the bar is first laid out
+        self._width_px = 0
+        self.bind("<Configure>", self._on_configure, add="+")
+        
     def set_progress(self, value: float, animate: bool = True):
         """Set progress value with optional smooth animation."""
         # Clamp value between 0 and 1
         value = max(0.0, min(1.0, value))
         
+        # Already showing this value; nothing to redraw
+        if abs(value - self._target_value) < 1e-4 and not self._is_animating:
+            return
+            
         if not animate:
+            if self._is_animating:
+                self._is_animating = False
+                _GlobalAnimator.get(self).unregister(self)
             self._target_value = value
             self._current_value = value
-            super().set(value)
+            self._draw(value, force=True)
+            return
+            
+        # Zero-delta animation: settle in place instead of animating
+        if abs(value - self._current_value) < 1e-4:
+            self._target_value = value
+            if self._is_animating:
+                self._is_animating = False
+                _GlobalAnimator.get(self).unregister(self)
             return
             
         # Start smooth animation
         self._target_value = value
         self._start_value = self._current_value
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         
         if not self._is_animating:
             self._is_animating = True
-            self._animate_progress()
+            _GlobalAnimator.get(self).register(self)
             
-    def _animate_progress(self):
-        """Animate progress bar smoothly."""
+    def _animate_progress(self) -> bool:
+        """Advance the animation by one frame; return False once finished."""
         if not self._is_animating:
-            return
+            return False
             
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self._start_time
         
         if elapsed >= self.animation_duration:
             # Animation complete
             self._current_value = self._target_value
-            super().set(self._current_value)
+            self._draw(self._current_value, force=True)
             self._is_animating = False
-            return
+            return False
             
-        # Calculate eased progress
-        progress = elapsed / self.animation_duration
-        eased_progress = self._ease_out_cubic(progress)
+        # Calculate eased progress (cubic ease-out, inlined: 1 - (1 - t)^3)
+        u = 1.0 - elapsed / self.animation_duration
+        eased_progress = 1.0 - u * u * u
         
         # Interpolate between start and target
         self._current_value = self._start_value + (self._target_value - self._start_value) * eased_progress
-        super().set(self._current_value)
-        
-        # Schedule next frame
-        self._animation_id = self.after(self.update_interval, self._animate_progress)
-        
-    def _ease_out_cubic(self, t: float) -> float:
-        """Cubic ease-out function for smooth animation."""
-        return 1 - (1 - t) ** 3
+        self._draw(self._current_value)
+        return True
+        
+    def _on_configure(self, event):
+        """Cache the bar's width; the pixel last drawn no longer applies."""
+        self._width_px = event.width
+        self._last_drawn_px = -1
+        
+    def _draw(self, value: float, force: bool = False):
+        """Redraw the bar only when the value moves it by at least a pixel."""
+        # Before the first layout the width is unknown, so compare raw values
+        quantized = round(value * self._width_px) if self._width_px > 1 else value
+        if quantized == self._last_drawn_px and (not force or value == self._last_drawn):
+            return
+        super().set(value)
+        self._last_drawn = value
+        self._last_drawn_px = quantized
         
     def increment(self, amount: float = 0.01, animate: bool = True):
         """Increment progress by a small amount."""
@@ -184,7 +278,7 @@ class StatusIndicator(ctk.CTkLabel):
 
 class LiveProgressTracker:
     """
-    Real-time progress tracker with threading and callbacks.
+    Real-time progress tracker with callbacks.
     """
     
     def __init__(
@@ -204,9 +298,9 @@ class LiveProgressTracker:
         self._is_running = False
         self._start_time = 0
         
-        # Threading
-        self._update_thread = None
-        self._stop_event = threading.Event()
+        # Optional time-based estimate, driven from the Tk main thread
+        self._estimate_duration: Optional[float] = None
+        self._estimate_id = None
         
     def start(self, total_steps: int = 100, status_message: str = "Starting..."):
         """Start progress tracking."""
@@ -214,16 +308,20 @@ class LiveProgressTracker:
         self._current_step = 0
         self._current_progress = 0.0
         self._is_running = True
-        self._start_time = time.time()
-        self._stop_event.clear()
+        self._start_time = time.monotonic()
         
         # Update UI
         self.progress_bar.reset(animate=True)
         self.status_indicator.set_status("running", status_message, animate=True)
         
-        # Start update thread
-        self._update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self._update_thread.start()
+        if self._estimate_duration:
+            self._schedule_estimate()
+            
+    def enable_time_estimate(self, duration_s: float = 30.0):
+        """Advance the bar on a time-based estimate when updates are sparse."""
+        self._estimate_duration = duration_s
+        if self._is_running:
+            self._schedule_estimate()
         
     def update(self, step: int, message: str = ""):
         """Update progress to a specific step."""
@@ -251,7 +349,7 @@ class LiveProgressTracker:
     def complete(self, message: str = "Completed successfully"):
         """Mark progress as complete."""
         self._is_running = False
-        self._stop_event.set()
+        self._cancel_estimate()
         
         # Update UI
         self.progress_bar.complete(animate=True)
@@ -264,7 +362,7 @@ class LiveProgressTracker:
     def error(self, message: str = "An error occurred"):
         """Mark progress as failed."""
         self._is_running = False
-        self._stop_event.set()
+        self._cancel_estimate()
         
         # Update UI
         self.status_indicator.set_status("error", message, animate=True)
@@ -272,33 +370,39 @@ class LiveProgressTracker:
     def stop(self, message: str = "Stopped by user"):
         """Stop progress tracking."""
         self._is_running = False
-        self._stop_event.set()
+        self._cancel_estimate()
         
         # Update UI
         self.status_indicator.set_status("stopping", message, animate=True)
         
-    def _update_loop(self):
-        """Background update loop for real-time progress."""
-        while self._is_running and not self._stop_event.is_set():
-            try:
-                # Calculate elapsed time
-                elapsed = time.time() - self._start_time
-                
-                # Update progress if needed
-                if self._current_progress < 1.0:
-                    # Estimate progress based on time if no updates
-                    estimated_progress = min(0.95, elapsed / 30)  # Assume 30s max
-                    if estimated_progress > self._current_progress:
-                        self.progress_bar.set_progress(estimated_progress, animate=True)
-                        
-                time.sleep(0.1)  # Update every 100ms
-                
-            except Exception:
-                break
+    def _schedule_estimate(self):
+        """Schedule the next time-based estimate tick on the Tk thread."""
+        if self._estimate_id is None:
+            self._estimate_id = self.progress_bar.after(100, self._tick_estimate)
+            
+    def _cancel_estimate(self):
+        """Cancel a pending time-based estimate tick."""
+        if self._estimate_id is not None:
+            self.progress_bar.after_cancel(self._estimate_id)
+            self._estimate_id = None
+            
+    def _tick_estimate(self):
+        """Move the bar forward on elapsed time if real updates lag behind."""
+        self._estimate_id = None
+        if not self._is_running or not self._estimate_duration:
+            return
+            
+        if self._current_progress < 1.0:
+            elapsed = time.monotonic() - self._start_time
+            estimated_progress = min(0.95, elapsed / self._estimate_duration)
+            if estimated_progress > self.progress_bar._target_value:
+                self.progress_bar.set_progress(estimated_progress, animate=True)
                 
+        self._schedule_estimate()
+        
     def get_elapsed_time(self) -> float:
         """Get elapsed time in seconds."""
-        return time.time() - self._start_time if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time else 0.0
         
     def get_estimated_remaining(self) -> float:
         """Get estimated remaining time in seconds."""
@@ -5,13 +5,37 @@ Designed by the Front End Architect & Designer
 
 from __future__ import annotations
 
+import logging
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Optional, Dict, Any, Callable
 import customtkinter as ctk
 
 from .modern_theme import theme
-from .glassmorphism import FloatingCard, AnimatedButton, ModernIcon, ModernTooltip
+from .glassmorphism import (
+    FloatingCard, AnimatedButton, ModernTooltip,
+    ICON_CLOSE, ICON_CROSS, ICON_CHECK
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Section field tables: (widget kind, label, setting name, widget options)
+_API_FIELDS = (
+    ("input", "YouTube API Key", "youtube_api_key",
+     {"placeholder_text": "Enter your YouTube API key", "show": "•"}),
+    ("file", "Google Service Account JSON", "service_account_path",
+     {"filetypes": [("JSON files", "*.json"), ("All files", "*.*")]}),
+    ("input", "Default Spreadsheet URL", "default_spreadsheet_url",
+     {"placeholder_text": "https://docs.google.com/spreadsheets/d/..."}),
+)
+
+_PERF_FIELDS = (
+    ("check", "Enable Animations", "enable_animations",
+     {"tooltip": "Enable smooth animations and transitions"}),
+    ("check", "Smooth Scrolling", "smooth_scrolling",
+     {"tooltip": "Enable smooth scrolling in text areas"}),
+)
 
 
 class ModernSettingsDialog(ctk.CTkToplevel):
@@ -21,24 +45,84 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         super().__init__(parent)
         self.app = app_instance
         self.title("⚙️ Settings - YouTube2Sheets")
-        self.geometry("800x600")
         self.transient(parent)
         self.grab_set()
         
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (800 // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (600 // 2)
-        self.geometry(f"+{x}+{y}")
+        # Size and center on parent without flushing idle tasks; a parent
+        # that is not laid out yet is centered on once it is
+        if parent.winfo_width() > 1:
+            self._center_on_parent()
+        else:
+            self.geometry("800x600")
+            self.after_idle(self._center_on_parent)
         
         # Settings state
         self.settings_changed = False
         
+        # Pending debounced theme application
+        self._theme_apply_job = None
+        
+        # Setting input widgets keyed by setting name
+        self.widgets: Dict[str, ctk.CTkBaseClass] = {}
+        
+        # Values as of the last save; a reshown dialog starts from these, so
+        # edits that were cancelled don't carry over
+        self._saved_values: Dict[str, Any] = {}
+        
         # Build the modern settings UI
         self._build_modern_settings_ui()
         
+    def _center_on_parent(self):
+        """Size the dialog and center it on its parent in one geometry call."""
+        parent = self.master
+        x = parent.winfo_x() + (parent.winfo_width() - 800) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - 600) // 2
+        self.geometry(f"800x600+{x}+{y}")
+        
+    @classmethod
+    def show(cls, parent, app_instance) -> "ModernSettingsDialog":
+        """Show the app's settings dialog, reusing the existing widget tree."""
+        dialog = getattr(app_instance, "_settings_dialog", None)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = cls(parent, app_instance)
+            app_instance._settings_dialog = dialog
+        else:
+            dialog._restore_saved_values()
+            dialog.settings_changed = False
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+        dialog.focus()
+        return dialog
+        
+    def _restore_saved_values(self):
+        """Put every setting widget back to its last saved value."""
+        self._build_pending_sections()
+        for name, widget in self.widgets.items():
+            self._set_widget_value(widget, self._saved_values.get(name))
+        self.theme_var.set("dark" if theme.is_dark else "light")
+        
+    @staticmethod
+    def _set_widget_value(widget, value: Any):
+        """Show value in a setting widget; None restores the widget's empty state."""
+        if isinstance(widget, ctk.CTkCheckBox):
+            if value:
+                widget.select()
+            else:
+                widget.deselect()
+        else:
+            widget.delete(0, "end")
+            if value:
+                widget.insert(0, value)
+        
     def _build_modern_settings_ui(self):
         """Build the modern settings interface."""
+        # Styles shared by many widgets below, looked up once per build
+        self._body_style = theme.text.body
+        self._caption_style = theme.text.caption
+        self._ghost_style = theme.button.ghost
+        self._subheading_style = theme.text.subheading
+        
         # Main container
         self.main_container = FloatingCard(self, elevation=12)
         self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -61,16 +145,16 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             header_frame,
             text="⚙️ Settings",
-            **theme.get_text_style("heading")
+            **theme.text.heading
         )
         title_label.pack(side="left")
         
         # Close button
         close_btn = AnimatedButton(
             header_frame,
-            text=f"{ModernIcon.get_icon('close')}",
+            text=ICON_CLOSE,
             command=self._close_dialog,
-            **theme.get_button_style("ghost")
+            **self._ghost_style
         )
         close_btn.pack(side="right")
         
@@ -79,72 +163,60 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         # Scrollable content
         content_frame = ctk.CTkScrollableFrame(self.main_container)
         content_frame.pack(fill="both", expand=True, padx=30, pady=(0, 20))
+        self._content_frame = content_frame
         
-        # API Configuration
+        # API Configuration is the only section that blocks first paint
         self._build_api_section(content_frame)
         
-        # Appearance
-        self._build_appearance_section(content_frame)
-        
-        # Performance
-        self._build_performance_section(content_frame)
-        
-    def _build_api_section(self, parent):
-        """Build API configuration section."""
-        api_card = FloatingCard(parent, elevation=8)
-        api_card.pack(fill="x", pady=(0, 20))
+        # Appearance and Performance are built once the dialog is idle
+        self._pending_sections: Dict[str, Callable] = {
+            "appearance": self._build_appearance_section,
+            "performance": self._build_performance_section,
+        }
+        self.after_idle(self._build_pending_sections)
+        
+    def _build_pending_sections(self):
+        """Build every deferred section exactly once, in order."""
+        if not self.winfo_exists():
+            return
+            
+        while self._pending_sections:
+            name = next(iter(self._pending_sections))
+            builder = self._pending_sections.pop(name)
+            builder(self._content_frame)
+            
+    def _section_card(self, parent, title_text: str, pady: Any = (0, 20)) -> ctk.CTkFrame:
+        """Create a packed section card with its header."""
+        # Plain bordered frame: nested inside the scrollable area, a
+        # FloatingCard's hover elevation is invisible but still redraws
+        card = ctk.CTkFrame(
+            parent,
+            corner_radius=16,
+            border_width=1,
+            border_color=("gray80", "gray30")
+        )
+        card.pack(fill="x", pady=pady)
         
         # Section header
-        header = ctk.CTkFrame(api_card, fg_color="transparent")
+        header = ctk.CTkFrame(card, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=(20, 10))
+        ctk.CTkLabel(header, text=title_text, **self._subheading_style).pack(side="left")
+        return card
         
-        title = ctk.CTkLabel(
-            header,
-            text="🔑 API Configuration",
-            **theme.get_text_style("subheading")
-        )
-        title.pack(side="left")
-        
-        # API Key
-        self._add_setting_input(
-            api_card, "YouTube API Key", "youtube_api_key",
-            placeholder="Enter your YouTube API key",
-            password=True
-        )
-        
-        # Service Account
-        self._add_setting_file_input(
-            api_card, "Google Service Account JSON", "service_account_path",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        
-        # Default Spreadsheet
-        self._add_setting_input(
-            api_card, "Default Spreadsheet URL", "default_spreadsheet_url",
-            placeholder="https://docs.google.com/spreadsheets/d/..."
-        )
+    def _build_api_section(self, parent):
+        """Build API configuration section."""
+        api_card = self._section_card(parent, "🔑 API Configuration")
+        self._build_fields(api_card, _API_FIELDS)
         
     def _build_appearance_section(self, parent):
         """Build appearance settings section."""
-        appearance_card = FloatingCard(parent, elevation=8)
-        appearance_card.pack(fill="x", pady=(0, 20))
-        
-        # Section header
-        header = ctk.CTkFrame(appearance_card, fg_color="transparent")
-        header.pack(fill="x", padx=20, pady=(20, 10))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="🎨 Appearance",
-            **theme.get_text_style("subheading")
-        )
-        title.pack(side="left")
+        appearance_card = self._section_card(parent, "🎨 Appearance")
         
         # Theme selection
         theme_frame = ctk.CTkFrame(appearance_card, fg_color="transparent")
         theme_frame.pack(fill="x", padx=20, pady=(0, 20))
         
-        self.theme_var = ctk.StringVar(value="dark")
+        self.theme_var = ctk.StringVar(value="dark" if theme.is_dark else "light")
         
         # Dark theme
         dark_theme_btn = ctk.CTkRadioButton(
@@ -153,7 +225,7 @@ class ModernSettingsDialog(ctk.CTkToplevel):
             variable=self.theme_var,
             value="dark",
             command=self._on_theme_change,
-            **theme.get_text_style("body")
+            **self._body_style
         )
         dark_theme_btn.pack(anchor="w", pady=(0, 10))
         
@@ -164,38 +236,20 @@ class ModernSettingsDialog(ctk.CTkToplevel):
             variable=self.theme_var,
             value="light",
             command=self._on_theme_change,
-            **theme.get_text_style("body")
+            **self._body_style
         )
         light_theme_btn.pack(anchor="w")
         
     def _build_performance_section(self, parent):
         """Build performance settings section."""
-        perf_card = FloatingCard(parent, elevation=8)
-        perf_card.pack(fill="x")
-        
-        # Section header
-        header = ctk.CTkFrame(perf_card, fg_color="transparent")
-        header.pack(fill="x", padx=20, pady=(20, 10))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="⚡ Performance",
-            **theme.get_text_style("subheading")
-        )
-        title.pack(side="left")
-        
-        # Enable animations
-        self._add_setting_checkbox(
-            perf_card, "Enable Animations", "enable_animations",
-            tooltip="Enable smooth animations and transitions"
-        )
-        
-        # Smooth scrolling
-        self._add_setting_checkbox(
-            perf_card, "Smooth Scrolling", "smooth_scrolling",
-            tooltip="Enable smooth scrolling in text areas"
-        )
+        perf_card = self._section_card(parent, "⚡ Performance", pady=0)
+        self._build_fields(perf_card, _PERF_FIELDS)
         
+    def _build_fields(self, card, fields):
+        """Build a section's setting widgets from a field table."""
+        for kind, label, setting_name, options in fields:
+            self._FIELD_BUILDERS[kind](self, card, label, setting_name, **options)
+            
     def _build_footer(self):
         """Build the settings footer with action buttons."""
         footer_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
@@ -208,18 +262,18 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         # Cancel button
         cancel_btn = AnimatedButton(
             buttons_frame,
-            text=f"{ModernIcon.get_icon('cross')} Cancel",
+            text=f"{ICON_CROSS} Cancel",
             command=self._cancel_settings,
-            **theme.get_button_style("ghost")
+            **self._ghost_style
         )
         cancel_btn.pack(side="right", padx=(0, 10))
         
         # Save button
         save_btn = AnimatedButton(
             buttons_frame,
-            text=f"{ModernIcon.get_icon('check')} Save",
+            text=f"{ICON_CHECK} Save",
             command=self._save_settings,
-            **theme.get_button_style("success")
+            **theme.button.success
         )
         save_btn.pack(side="right")
         
@@ -233,20 +287,18 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         input_label = ctk.CTkLabel(
             input_frame,
             text=label,
-            **theme.get_text_style("caption")
+            **self._caption_style
         )
         input_label.pack(anchor="w", padx=20, pady=(0, 5))
         
-        # Input field
-        input_field = ctk.CTkEntry(
-            input_frame,
-            **theme.get_input_style(),
-            **kwargs
-        )
+        # Input field; theme styles are fresh copies, so merge in place
+        options = theme.input_
+        options.update(kwargs)
+        input_field = ctk.CTkEntry(input_frame, **options)
         input_field.pack(fill="x", padx=20)
         
         # Store reference
-        setattr(self, f"{setting_name}_entry", input_field)
+        self.widgets[setting_name] = input_field
         
     def _add_setting_file_input(self, parent, label: str, setting_name: str, **kwargs):
         """Add a setting file input field."""
@@ -258,7 +310,7 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         input_label = ctk.CTkLabel(
             input_frame,
             text=label,
-            **theme.get_text_style("caption")
+            **self._caption_style
         )
         input_label.pack(anchor="w", padx=20, pady=(0, 5))
         
@@ -269,7 +321,7 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         # Input field
         input_field = ctk.CTkEntry(
             input_container,
-            **theme.get_input_style()
+            **theme.input_
         )
         input_field.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
@@ -278,12 +330,12 @@ class ModernSettingsDialog(ctk.CTkToplevel):
             input_container,
             text="Browse",
             command=lambda: self._browse_file(input_field, **kwargs),
-            **theme.get_button_style("secondary")
+            **theme.button.secondary
         )
         browse_btn.pack(side="right")
         
         # Store reference
-        setattr(self, f"{setting_name}_entry", input_field)
+        self.widgets[setting_name] = input_field
         
     def _add_setting_checkbox(self, parent, label: str, setting_name: str, **kwargs):
         """Add a setting checkbox."""
@@ -295,12 +347,19 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         checkbox = ctk.CTkCheckBox(
             checkbox_frame,
             text=label,
-            **theme.get_text_style("body")
+            **self._body_style
         )
         checkbox.pack(anchor="w", padx=20)
         
         # Store reference
-        setattr(self, f"{setting_name}_checkbox", checkbox)
+        self.widgets[setting_name] = checkbox
+        
+    # Field-table widget kinds mapped to their builder methods
+    _FIELD_BUILDERS = {
+        "input": _add_setting_input,
+        "file": _add_setting_file_input,
+        "check": _add_setting_checkbox,
+    }
         
     def _on_theme_change(self):
         """Handle theme change."""
@@ -309,10 +368,20 @@ class ModernSettingsDialog(ctk.CTkToplevel):
             theme.is_dark = True
         elif theme_name == "light":
             theme.is_dark = False
-            
-        # Apply theme
-        theme.apply_theme(self.root)
         self.settings_changed = True
+            
+        # Apply theme once the selection settles
+        if self._theme_apply_job is not None:
+            self.after_cancel(self._theme_apply_job)
+        self._theme_apply_job = self.after(80, self._apply_theme_now)
+        
+    def _apply_theme_now(self):
+        """Apply the selected theme to the application window."""
+        self._theme_apply_job = None
+        try:
+            theme.apply_theme(self.app.root)
+        except Exception:
+            logger.warning("Theme apply failed", exc_info=True)
         
     def _browse_file(self, entry_field, **kwargs):
         """Browse for a file."""
@@ -332,8 +401,11 @@ class ModernSettingsDialog(ctk.CTkToplevel):
             
     def _save_settings(self):
         """Save settings."""
+        # Deferred sections must exist before their values can be read
+        self._build_pending_sections()
+        
         # Save all settings
-        self._save_all_settings()
+        self._saved_values = self._save_all_settings()
         
         # Show success message
         messagebox.showinfo("Settings Saved", "Settings have been saved successfully!")
@@ -342,10 +414,20 @@ class ModernSettingsDialog(ctk.CTkToplevel):
         self._close_dialog()
         
     def _close_dialog(self):
-        """Close the settings dialog."""
-        self.destroy()
-        
-    def _save_all_settings(self):
+        """Hide the settings dialog so it can be reshown without rebuilding."""
+        # Release the local grab; a withdrawn window must not keep routing events
+        try:
+            self.grab_release()
+        except tk.TclError:
+            pass
+        self.withdraw()
+        
+    def get_setting(self, setting_name: str) -> Any:
+        """Return the current value of a setting widget."""
+        return self.widgets[setting_name].get()
+        
+    def _save_all_settings(self) -> Dict[str, Any]:
         """Save all settings to configuration."""
+        config = {name: widget.get() for name, widget in self.widgets.items()}
         # Save all settings to config file
-        pass
\ No newline at end of file
+        return config
\ No newline at end of file
@@ -8,40 +8,61 @@ from typing import Literal
 
 StatusType = Literal["ready", "running", "success", "error", "warning"]
 
+_STATUS_COLORS = {
+    "ready": "#00FF9D",      # Bright green
+    "running": "#00D9FF",    # Cyan
+    "success": "#00FF9D",    # Green
+    "error": "#FF4D6A",      # Red
+    "warning": "#FFC107",    # Yellow/Orange
+}
+_DEFAULT_COLOR = _STATUS_COLORS["ready"]
+
 
 class StatusIndicator(ctk.CTkFrame):
     """Professional status indicator with color-coded visual feedback"""
 
-    COLORS = {
-        "ready": "#00FF9D",      # Bright green
-        "running": "#00D9FF",    # Cyan
-        "success": "#00FF9D",    # Green
-        "error": "#FF4D6A",      # Red
-        "warning": "#FFC107",    # Yellow/Orange
-    }
+    COLORS = _STATUS_COLORS
+    
+    # Fonts shared by every instance, created on first use
+    _FONT_DOT = None
+    _FONT_TEXT = None
 
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
+        cls = type(self)
+        if cls._FONT_DOT is None:
+            cls._FONT_DOT = ctk.CTkFont(size=18)
+            cls._FONT_TEXT = ctk.CTkFont(size=14, weight="bold")
+        
         self.indicator = ctk.CTkLabel(
             self,
             text="●",
-            font=ctk.CTkFont(size=18),
-            text_color=self.COLORS["ready"]
+            font=cls._FONT_DOT,
+            text_color=_DEFAULT_COLOR
         )
         self.indicator.pack(side="left", padx=(0, 5))
         
         self.text = ctk.CTkLabel(
             self,
             text="Ready",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=cls._FONT_TEXT,
             text_color="#FFFFFF"
         )
         self.text.pack(side="left")
+        
+        # Last displayed state, so repeated updates skip Tk reconfiguration
+        self._last_status = "ready"
+        self._last_message = "Ready"
     
     def update_status(self, message: str, status_type: StatusType = "ready"):
         """Update the status indicator"""
-        color = self.COLORS.get(status_type, self.COLORS["ready"])
-        self.indicator.configure(text_color=color)
-        self.text.configure(text=message)
+        if status_type == self._last_status and message == self._last_message:
+            return
+        if status_type != self._last_status:
+            self.indicator.configure(text_color=_STATUS_COLORS.get(status_type, _DEFAULT_COLOR))
+            self._last_status = status_type
+        if message != self._last_message:
+            self.text.configure(text=message)
+            self._last_message = message
 
@@ -6,13 +6,21 @@ Matches the provided screenshots exactly with all required functionality.
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 import threading
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterable, Optional
 
 import customtkinter as ctk
 from datetime import datetime
@@ -28,9 +36,11 @@ from src.backend.security_manager import default_spreadsheet_url, get_env_var, v
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config_loader import load_config, save_config
 from src.backend.youtube2sheets import SyncConfig
+from src.domain.models import Destination, Filters, RunConfig, RunStatus
 from src.services.automator import YouTubeToSheetsAutomator
 from src.services.spreadsheet_manager import SpreadsheetManager
-from src.services.sheets_service import SheetsService, SheetsConfig
+from src.services.sheets_service import SheetsService, SheetsConfig, clear_credentials_cache
+from src.utils.browser_like_scrolling import BrowserLikeScrolling
 from src.utils.validators import SyncValidator
 from src.config import load_gui_config, load_logging_config
 
@@ -69,33 +79,150 @@ def _configure_logging() -> None:
         handlers=handlers,
     )
 
+# Loggers whose records are mirrored into the GUI activity log
+_ALLOWED_LOGGERS = frozenset({'youtube_service', 'src.services.automator', 'sheets_service'})
+
+class _AllowedLoggerFilter(logging.Filter):
+    """Pass only records from the loggers mirrored into the GUI (or their children)."""
+    
+    def filter(self, record):
+        name = record.name
+        return any(name == allowed or name.startswith(allowed + '.') for allowed in _ALLOWED_LOGGERS)
+
 # Add custom handler to send logs to GUI
-class GUILogHandler(logging.Handler):
-    def __init__(self, gui_callback):
-        super().__init__()
-        self.gui_callback = gui_callback
+class GUILogHandler(logging.handlers.QueueHandler):
+    """Queue relevant log lines for the GUI; the Tk thread drains them in batches."""
     
-    def emit(self, record):
-        try:
-            msg = self.format(record)
-            # Only show INFO and above, and filter to relevant loggers
-            if record.levelno >= logging.INFO and any(name in record.name for name in ['youtube_service', 'automator', 'sheets_service']):
-                # Extract just the message part (remove timestamp and logger name)
-                if ' - INFO - ' in msg:
-                    clean_msg = msg.split(' - INFO - ', 1)[1]
-                elif ' - WARNING - ' in msg:
-                    clean_msg = msg.split(' - WARNING - ', 1)[1]
-                elif ' - ERROR - ' in msg:
-                    clean_msg = msg.split(' - ERROR - ', 1)[1]
-                else:
-                    clean_msg = msg
-                self.gui_callback(clean_msg)
-        except:
-            pass
+    # emit() is QueueHandler's own: rejected records never get this far, and
+    # a failure in prepare() goes to handleError() instead of being swallowed
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        # Level and logger-name checks run in the logging framework, before
+        # emit() is dispatched; DEBUG records never reach this handler
+        self.setLevel(logging.INFO)
+        self.addFilter(_AllowedLoggerFilter())
+    
+    def prepare(self, record):
+        # Enqueue the display line itself: the handler has no formatter, so
+        # this is the bare message (plus any traceback), as it always was; the
+        # indent sets logger lines apart from the GUI's own timestamped entries
+        return '   ' + self.format(record)
+
+# 2026 Premium Design Tokens, shared read-only by every window
+_COLORS = MappingProxyType({
+    # Core backgrounds
+    'bg': '#0B0E14',           # Deep dark background
+    'surface': '#111520',      # Card surface
+    'surface_light': '#16213e', # Lighter surface
+    'surface_2': '#151A28',    # Elevated surface
+    'border': '#1E2433',       # Subtle borders
+    'border_light': '#475569', # Lighter borders
+    'border_dark': '#0F172A',  # Darker borders
+    
+    # Text hierarchy
+    'text_1': '#F5F7FA',       # Primary text (high contrast)
+    'text_2': '#C6CBD6',       # Secondary text
+    'muted': '#8A90A4',        # Muted text
+    
+    # Action colors
+    'primary': '#2DE37B',      # Run/confirm (green)
+    'primary_dark': '#26C96C', # Darker green
+    'primary_light': '#34D399', # Lighter green
+    'secondary': '#00BFA6',    # Refresh/utility (teal)
+    'secondary_dark': '#00A693', # Darker teal
+    'secondary_light': '#22D3EE', # Lighter teal
+    'accent': '#7C3AED',       # Selection/focus (purple)
+    'accent_dark': '#6D28D9',  # Darker purple
+    'accent_light': '#A78BFA', # Lighter purple
+    'danger': '#EF4444',       # Destructive actions
+    'danger_dark': '#DC2626',  # Darker red
+    'danger_light': '#F87171', # Lighter red
+    'warn': '#F59E0B',         # Warnings
+    'warn_dark': '#D97706',    # Darker amber
+    'warn_light': '#FBBF24',   # Lighter amber
+    'info': '#38BDF8',         # Info
+    'info_dark': '#0EA5E9',    # Darker cyan
+    'info_light': '#67E8F9',   # Lighter cyan
+    'focus_ring': '#7C3AED80', # Focus outline
+    
+    # Legacy compatibility
+    'background': '#0B0E14',
+    'text_primary': '#F5F7FA',
+    'text_secondary': '#C6CBD6',
+    'text_muted': '#8A90A4',
+    'success': '#2DE37B',
+    'error': '#EF4444',
+    'error_dark': '#DC2626',
+    'error_light': '#F87171',
+    'warning': '#F59E0B',
+})
+
+# 2026 Spacing Scale (4, 8, 12, 16, 24, 32)
+_SPACING = MappingProxyType({
+    'xs': 4,
+    'sm': 8,
+    'md': 12,
+    'lg': 16,
+    'xl': 24,
+    '2xl': 32,
+})
+
+# 2026 Radius Scale (consistent 12px for cards, 10px for fields)
+_RADIUS = MappingProxyType({
+    'card': 12,
+    'field': 10,
+    'chip': 16,
+    'button': 12,
+    'full': 9999,  # For circular elements
+})
+
+# Channel input patterns, compiled once for the per-keystroke recount
+_CHANNEL_SPLIT_RE = re.compile(r'[,\s\n]+')
+_CHANNEL_ID_RE = re.compile(r'\bUC[\w-]{22}\b', re.I)
+_CHANNEL_URL_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?youtube\.com/(?:channel/|c/|user/|@)([^/\s?]+)', re.I
+)
+_HANDLE_RE = re.compile(r'@[\w\.\-]{3,}')
+
+# Spreadsheet ID inside a Google Sheets URL
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# Placeholder shown in the empty channel textbox
+_CHANNEL_PLACEHOLDER = (
+    "Paste channels here (URLs, @handles, or IDs)...\n\n"
+    "• Channel Handle: @channelname (e.g., @mkbhd)\n"
+    "• Channel URL: https://www.youtube.com/@channelname\n"
+    "• Channel ID: UC... (e.g., UCX60Q3DkcsbYNE6H8uQQu-A)\n\n"
+    "Separate multiple channels with newlines, commas, or spaces."
+)
+
+# Shared CTkFont instances keyed by (size, weight); identical specs reuse one
+# Tk named font instead of allocating a new one per widget or window
+_FONT_CACHE: dict[tuple[int, str], ctk.CTkFont] = {}
+
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    font = _FONT_CACHE.get((size, weight))
+    if font is None:
+        font = _FONT_CACHE[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+    return font
 
 # This will be set by the GUI app instance
 _gui_log_handler = None
 
+
+@dataclass(frozen=True)
+class _SyncInputs:
+    """Sync form inputs, read once on the Tk thread when a sync starts."""
+
+    channel_input: str
+    tab_name: str
+    use_existing: bool
+    sheet_id: str
+    youtube_key: str
+    service_account: str
+
+
 # Set dark theme to match images
 ctk.set_appearance_mode("dark")
 try:
@@ -108,34 +235,79 @@ class YouTube2SheetsGUI:
     """Main window with exact layout matching the provided images."""
     
     _instance = None
-    _initialized = False
+    _instance_lock = threading.Lock()
     
-    def __new__(cls):
-        """Ensure only one instance exists (singleton pattern)."""
+    # Queued log lines are flushed to the activity log at most this often, in
+    # batches of up to LOG_DRAIN_BATCH lines
+    LOG_DRAIN_INTERVAL_MS = 50
+    LOG_DRAIN_BATCH = 200
+    
+    # Lines kept in the activity log and its in-memory ring buffer
+    MAX_LOG_LINES = 5000
+    
+    # Written to the activity log once it has been built
+    STARTUP_LOG_MESSAGES = (
+        "YouTube2Sheets GUI initialized",
+        "Ready to process YouTube channels",
+        "All systems operational",
+        "Note: For real API integration, run setup_api_credentials.py",
+        "☑ Configuration loaded successfully",
+        "Auto-refreshing tabs on startup...",
+        "Startup refresh complete! Current selection: AI_ML",
+    )
+    
+    # Sticky action bar buttons: attribute, label, width, colour key, handler, initial state
+    _ACTION_SPEC = (
+        ('run_btn', "▶ Start Automation Run", 220, 'primary', 'start_sync', "normal"),
+        ('schedule_btn', "📅 Schedule Run", 200, 'info', '_schedule_run', "normal"),
+        ('cancel_btn', "⛔ Cancel Run", 200, 'danger', 'stop_sync', "disabled"),
+    )
+    
+    @classmethod
+    def instance(cls) -> "YouTube2SheetsGUI":
+        """Return the application window, building it on the first call."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    gui = super().__new__(cls)
+                    gui._real_init()
+                    # Published only once fully built, so a failed build is retried
+                    cls._instance = gui
         return cls._instance
+    
+    def __new__(cls):
+        """Ensure only one instance exists; ``YouTube2SheetsGUI()`` is ``instance()``."""
+        return cls.instance()
 
-    def __init__(self) -> None:
-        # Prevent multiple initialization using class variable
-        if YouTube2SheetsGUI._initialized:
-            return
-        YouTube2SheetsGUI._initialized = True
+    def _real_init(self) -> None:
+        """Build the window and its state; runs exactly once via instance()."""
         _configure_logging()
         gui_config = load_gui_config()
         
         # Load configuration
         self.config = load_config()
         
-        # Set up GUI log handler to capture diagnostic logs
+        # Background pool for Google API calls made on behalf of the UI. Its
+        # results come back through _tk_calls, which the log drain loop runs
+        # on the Tk thread; done-callbacks fire on pool threads and must not
+        # touch Tk, root.after included
+        self._bg = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yt2s-bg")
+        self._tk_calls = queue.SimpleQueue()
+        
+        # Set up GUI log handler to capture diagnostic logs; worker threads only
+        # enqueue, and the Tk thread drains the queue in _drain_log_queue
+        self._log_queue = queue.SimpleQueue()
         global _gui_log_handler
         if _gui_log_handler is None:
-            _gui_log_handler = GUILogHandler(self._append_log_from_logger)
+            _gui_log_handler = GUILogHandler(self._log_queue)
             logging.getLogger('youtube_service').addHandler(_gui_log_handler)
             logging.getLogger('src.services.automator').addHandler(_gui_log_handler)
             logging.getLogger('sheets_service').addHandler(_gui_log_handler)
         
         self.root = ctk.CTk()
+        # Keep the window unmapped while the widget tree is built so the
+        # pack/grid passes are settled once instead of redrawn per section
+        self.root.withdraw()
         self.root.title("YouTube2Sheets - Professional Automation Suite")
         
         # Dynamic sizing based on current screen (adaptive & centered)
@@ -147,9 +319,10 @@ class YouTube2SheetsGUI:
         y = (screen_h // 2) - (H // 2)
         self.root.geometry(f"{W}x{H}+{x}+{y}")
         self.root.minsize(1100, 720)
+        self._window_size = (W, H)
         
-        # Configure premium appearance
-        ctk.set_appearance_mode("dark")
+        # Appearance mode is already dark from module import; widgets here are
+        # styled against the stock blue theme rather than yt2s_theme.json
         ctk.set_default_color_theme("blue")
         
         # Initialize modern design system first
@@ -158,134 +331,78 @@ class YouTube2SheetsGUI:
         # Premium window styling with dark theme
         self.root.configure(fg_color=self.colors['background'])
         
-        # Center the window
+        # Settle the layout once (the adaptive geometry above already
+        # centers the window), then show it
         self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (1600 // 2)
-        y = (self.root.winfo_screenheight() // 2) - (1000 // 2)
-        self.root.geometry(f"1400x900+{x}+{y}")
+        self.root.deiconify()
 
         # Setup cleanup handler for proper resource management
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+        # Start draining queued log lines into the activity log
+        self._log_drain_id = self.root.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+
         self._automator: Optional[YouTubeToSheetsAutomator] = None
         self._worker_thread: Optional[threading.Thread] = None
         self._stop_flag = threading.Event()
     
     def _init_design_system(self) -> None:
         """Initialize 2026 design system with premium tokens and accessibility."""
-        # 2026 Premium Design Tokens
-        self.colors = {
-            # Core backgrounds
-            'bg': '#0B0E14',           # Deep dark background
-            'surface': '#111520',      # Card surface
-            'surface_light': '#16213e', # Lighter surface
-            'surface_2': '#151A28',    # Elevated surface
-            'border': '#1E2433',       # Subtle borders
-            'border_light': '#475569', # Lighter borders
-            'border_dark': '#0F172A',  # Darker borders
-            
-            # Text hierarchy
-            'text_1': '#F5F7FA',       # Primary text (high contrast)
-            'text_2': '#C6CBD6',       # Secondary text
-            'muted': '#8A90A4',        # Muted text
-            
-            # Action colors
-            'primary': '#2DE37B',      # Run/confirm (green)
-            'primary_dark': '#26C96C', # Darker green
-            'primary_light': '#34D399', # Lighter green
-            'secondary': '#00BFA6',    # Refresh/utility (teal)
-            'secondary_dark': '#00A693', # Darker teal
-            'secondary_light': '#22D3EE', # Lighter teal
-            'accent': '#7C3AED',       # Selection/focus (purple)
-            'accent_dark': '#6D28D9',  # Darker purple
-            'accent_light': '#A78BFA', # Lighter purple
-            'danger': '#EF4444',       # Destructive actions
-            'danger_dark': '#DC2626',  # Darker red
-            'danger_light': '#F87171', # Lighter red
-            'warn': '#F59E0B',         # Warnings
-            'warn_dark': '#D97706',    # Darker amber
-            'warn_light': '#FBBF24',   # Lighter amber
-            'info': '#38BDF8',         # Info
-            'info_dark': '#0EA5E9',    # Darker cyan
-            'info_light': '#67E8F9',   # Lighter cyan
-            'focus_ring': '#7C3AED80', # Focus outline
-            
-            # Legacy compatibility
-            'background': '#0B0E14',
-            'text_primary': '#F5F7FA',
-            'text_secondary': '#C6CBD6',
-            'text_muted': '#8A90A4',
-            'success': '#2DE37B',
-            'error': '#EF4444',
-            'error_dark': '#DC2626',
-            'error_light': '#F87171',
-            'warning': '#F59E0B',
-        }
+        # 2026 Premium Design Tokens (shared, read-only)
+        self.colors = _COLORS
+        self.spacing = _SPACING
+        self.radius = _RADIUS
         
         # Modern typography scale
         self.fonts = {
-            'h1': ctk.CTkFont(size=32, weight="bold"),
-            'h2': ctk.CTkFont(size=24, weight="bold"),
-            'h3': ctk.CTkFont(size=20, weight="bold"),
-            'h4': ctk.CTkFont(size=18, weight="bold"),
-            'h5': ctk.CTkFont(size=16, weight="bold"),
-            'h6': ctk.CTkFont(size=14, weight="bold"),
-            'body_large': ctk.CTkFont(size=16, weight="normal"),
-            'body': ctk.CTkFont(size=14, weight="normal"),
-            'body_small': ctk.CTkFont(size=12, weight="normal"),
-            'caption': ctk.CTkFont(size=11, weight="normal"),
-            'helper': ctk.CTkFont(size=11, weight="normal"),
-            'label': ctk.CTkFont(size=12, weight="normal"),  # ADDED MISSING LABEL FONT
-            'input': ctk.CTkFont(size=12, weight="normal"),  # ADDED MISSING INPUT FONT
-            'chip': ctk.CTkFont(size=10, weight="normal"),   # ADDED MISSING CHIP FONT
-            'button': ctk.CTkFont(size=14, weight="bold"),
-            'button_small': ctk.CTkFont(size=12, weight="bold"),
+            'h1': _font(32, "bold"),
+            'h2': _font(24, "bold"),
+            'h3': _font(20, "bold"),
+            'h4': _font(18, "bold"),
+            'h5': _font(16, "bold"),
+            'h6': _font(14, "bold"),
+            'body_large': _font(16),
+            'body': _font(14),
+            'body_small': _font(12),
+            'caption': _font(11),
+            'helper': _font(11),
+            'label': _font(12),  # ADDED MISSING LABEL FONT
+            'input': _font(12),  # ADDED MISSING INPUT FONT
+            'chip': _font(10),   # ADDED MISSING CHIP FONT
+            'button': _font(14, "bold"),
+            'button_small': _font(12, "bold"),
+            'button_xs': _font(11),
+            'status_bold': _font(12, "bold"),
+            'label_bold': _font(12, "bold"),
+            'mono_log': ctk.CTkFont(family="Consolas", size=12),
         }
         
-        # 2026 Spacing Scale (4, 8, 12, 16, 24, 32)
-        self.spacing = {
-            'xs': 4,
-            'sm': 8,
-            'md': 12,
-            'lg': 16,
-            'xl': 24,
-            '2xl': 32,
-        }
-        
-        # 2026 Radius Scale (consistent 12px for cards, 10px for fields)
-        self.radius = {
-            'card': 12,
-            'field': 10,
-            'chip': 16,
-            'button': 12,
-            'full': 9999,  # For circular elements
-        }
-
         self._build_state()
         self._build_ui()
 
-        # Update spreadsheet dropdown with loaded spreadsheets
-        self.root.after(100, self._update_spreadsheet_dropdown)
-
-        # Auto-refresh tabs on startup
-        self.root.after(1000, self._refresh_tabs)
+        # Fill the spreadsheet dropdown and auto-refresh tabs once the window
+        # is idle; the tab fetch itself runs on the background pool
+        self.root.after_idle(self._startup_refresh)
         
         # Add keyboard shortcuts
         self._setup_keyboard_shortcuts()
 
+    def _startup_refresh(self) -> None:
+        """Populate startup data: local spreadsheet list first, then remote tabs."""
+        self._update_spreadsheet_dropdown()
+        self._refresh_tabs()
+
     def _build_state(self) -> None:
         """Initialize all GUI state variables."""
         self.youtube_api_key_var = ctk.StringVar(value=os.getenv("YOUTUBE_API_KEY", ""))
         self.service_account_path_var = ctk.StringVar(value=os.getenv("GOOGLE_SHEETS_SERVICE_ACCOUNT_JSON", ""))
         self.sheet_url_var = ctk.StringVar(value=default_spreadsheet_url() or "")
         self.tab_name_var = ctk.StringVar(value="AI_ML")
-        self.channel_var = ctk.StringVar(value="")
-        self.min_duration_var = ctk.StringVar(value="60")
-        self.keyword_filter_var = ctk.StringVar(value="")
-        self.keyword_mode_var = ctk.StringVar(value="include")
+        self.channel_input = ""  # plain text; nothing binds to it
         self.use_existing_tab_var = ctk.BooleanVar(value=True)
         self.exclude_shorts_var = ctk.BooleanVar(value=True)
         self.debug_logging_var = ctk.BooleanVar(value=False)
+        self.channel_count_var = ctk.StringVar(value="0 channels")
         
         # Multi-spreadsheet support variables
         self.current_spreadsheet_var = ctk.StringVar(value="")
@@ -311,16 +428,48 @@ class YouTube2SheetsGUI:
                 if first_sheet:
                     self.current_spreadsheet_id = first_sheet.id
         
-        # Initialize logging system
-        self.log_lines = []
-        self.max_log_lines = 1000
-        self.MAX_LOG_LINES = 5000
+        # Pending throttled relayout after a root resize
+        self._resize_after = None
+        
+        # Pending debounced recount of the channel textbox
+        self._channel_parse_after = None
+        
+        # Pending debounced capture of channel input
+        self._pending_change = None
+        
+        # Sheets API clients shared by every thread, one idle client per key.
+        # A client is checked out while in use (leases map id -> key and
+        # generation); bumping the generation drops clients still checked out
+        self._sheets_cache: dict[tuple, SheetsService] = {}
+        self._sheets_leases: dict[int, tuple] = {}
+        self._sheets_lock = threading.Lock()
+        self._sheets_generation = 0
+        
+        # Bumped by every tab refresh; a fetch whose number is no longer
+        # current finished after a newer refresh and its tabs are dropped
+        self._tabs_request = 0
+        
+        # Scheduler window and settings dialog, built on first open
+        self._scheduler_window: Optional[ctk.CTkToplevel] = None
+        self._settings_dialog: Optional[ctk.CTkToplevel] = None
+        
+        # Channel chips in insertion order (channel -> chip widgets)
+        self.channel_chips: dict[str, tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton]] = {}
+        
+        # Initialize logging system (ring buffer; oldest lines fall off)
+        self.log_lines = deque(maxlen=self.MAX_LOG_LINES)
+        self._log_widget_lines = 0
 
     def _build_ui(self) -> None:
         """Build the exact UI layout with CTkScrollableFrame for perfect edge-to-edge expansion."""
         # 🔁 Replace Canvas hack with CTkScrollableFrame (removes right gap)
+        # Request roughly the final size up front (window minus padding and the
+        # sticky bar/status bar) so the first layout pass doesn't re-measure
+        W, H = self._window_size
         self.page = ctk.CTkScrollableFrame(
             self.root,
+            width=W - 24,
+            height=H - 200,
             fg_color=self.colors['background'],
             corner_radius=0
         )
@@ -328,7 +477,6 @@ class YouTube2SheetsGUI:
         self.page.pack(fill="both", expand=True, padx=12, pady=(12, 0))
 
         # EXTREME ROCKET scrolling for maximum responsiveness
-        from src.utils.browser_like_scrolling import BrowserLikeScrolling
         self.scroll_handler = BrowserLikeScrolling(self.page, scroll_speed=200.0, smooth_factor=0.998)
 
         # Header section
@@ -501,10 +649,18 @@ class YouTube2SheetsGUI:
         self._build_filter_settings_section(self.right_column)
 
         # Optional: responsive stack for small widths
-        self.root.bind("<Configure>", self._responsive_stack)
+        self.root.bind("<Configure>", self._on_root_configure)
+
+    def _on_root_configure(self, evt) -> None:
+        """Coalesce root resize events so the relayout runs at most every 50 ms."""
+        # Child widgets' <Configure> events also reach the root binding
+        if evt.widget is not self.root or self._resize_after is not None:
+            return
+        self._resize_after = self.root.after(50, self._responsive_stack)
 
     def _responsive_stack(self, _evt=None):
         """Responsive layout that stacks columns on small screens."""
+        self._resize_after = None
         w = self.root.winfo_width()
         if w < 1200 and getattr(self, "_stacked", False) is False:
             self._stacked = True
@@ -567,36 +723,26 @@ class YouTube2SheetsGUI:
         self.channel_textbox.pack(fill="x", pady=(0, self.spacing['sm']))
         
         # Add placeholder text INSIDE the textbox
-        placeholder_text = (
-            "Paste channels here (URLs, @handles, or IDs)...\n\n"
-            "• Channel Handle: @channelname (e.g., @mkbhd)\n"
-            "• Channel URL: https://www.youtube.com/@channelname\n"
-            "• Channel ID: UC... (e.g., UCX60Q3DkcsbYNE6H8uQQu-A)\n\n"
-            "Separate multiple channels with newlines, commas, or spaces."
-        )
-        self.channel_textbox.insert("1.0", placeholder_text)
+        self.channel_textbox.insert("1.0", _CHANNEL_PLACEHOLDER)
         self.channel_textbox.configure(text_color=self.colors['muted'])
         
         # Bind events for placeholder behavior and live count
-        self.channel_textbox.bind("<Button-1>", self._on_channel_textbox_click)
-        self.channel_textbox.bind("<FocusIn>", self._on_channel_textbox_focus_in)
-        self.channel_textbox.bind("<FocusOut>", self._on_channel_textbox_focus_out)
+        self.channel_textbox.bind("<Button-1>", self._handle_channel_placeholder)
+        self.channel_textbox.bind("<FocusIn>", self._handle_channel_placeholder)
+        self.channel_textbox.bind("<FocusOut>", partial(self._handle_channel_placeholder, focus_out=True))
         self.channel_textbox.bind("<KeyRelease>", self._on_channel_textbox_change)
         
         # Channel count badge
         self.channel_count_label = ctk.CTkLabel(
             channel_container,
-            text="0 channels",
+            textvariable=self.channel_count_var,
             font=self.fonts['caption'],
             text_color=self.colors['muted']
         )
         self.channel_count_label.pack(anchor="w", pady=(self.spacing['sm'], 0))
         
-        # Initialize channel chips
-        self.channel_chips = []
-        
         # Store placeholder text for behavior
-        self.channel_placeholder_text = placeholder_text
+        self.channel_placeholder_text = _CHANNEL_PLACEHOLDER
         self.channel_placeholder_active = True
 
     def _build_target_destination_section(self, parent: ctk.CTkBaseClass) -> None:
@@ -719,10 +865,13 @@ class YouTube2SheetsGUI:
         # Tab input container
         tab_input_frame = ctk.CTkFrame(sheet_frame, fg_color="transparent")
         tab_input_frame.pack(fill="x", pady=(self.spacing['sm'], 0))
+        tab_input_frame.grid_columnconfigure(0, weight=1)
         
+        # Both modes share one grid cell; _toggle_tab_mode hides one with
+        # grid_remove, which keeps its grid options for a cheap restore
         # Tab name input (for new tabs)
         self.new_tab_frame = ctk.CTkFrame(tab_input_frame, fg_color="transparent")
-        self.new_tab_frame.pack(fill="x")
+        self.new_tab_frame.grid(row=0, column=0, sticky="ew")
         
         new_tab_label = ctk.CTkLabel(
             self.new_tab_frame,
@@ -746,7 +895,7 @@ class YouTube2SheetsGUI:
         
         # Existing tab dropdown (for existing tabs)
         self.existing_tab_frame = ctk.CTkFrame(tab_input_frame, fg_color="transparent")
-        self.existing_tab_frame.pack(fill="x")
+        self.existing_tab_frame.grid(row=0, column=0, sticky="ew")
         
         existing_tab_label = ctk.CTkLabel(
             self.existing_tab_frame,
@@ -796,12 +945,14 @@ class YouTube2SheetsGUI:
 
     def _build_filter_settings_section(self, parent: ctk.CTkBaseClass) -> None:
         """Build the Filter Settings section (right column, top) with premium 2026 styling."""
+        c, s, r, f = self.colors, self.spacing, self.radius, self.fonts
+        # Sits on the same surface colour as the right column, so no fill of its own
         section_frame = ctk.CTkFrame(
             parent, 
-            corner_radius=self.radius['card'], 
-            fg_color=self.colors['surface'], 
+            corner_radius=r['card'], 
+            fg_color="transparent", 
             border_width=1, 
-            border_color=self.colors['border']
+            border_color=c['border']
         )
         section_frame.grid(row=0, column=0, sticky="nsew")
         section_frame.grid_columnconfigure(0, weight=1)
@@ -809,21 +960,21 @@ class YouTube2SheetsGUI:
         
         # Premium section header
         header_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        header_frame.grid(row=0, column=0, sticky="ew", padx=self.spacing['lg'], pady=(self.spacing['lg'], self.spacing['md']))
+        header_frame.grid(row=0, column=0, sticky="ew", padx=s['lg'], pady=(s['lg'], s['md']))
         header_frame.grid_columnconfigure(0, weight=1)
         
         # Main title with icon
         title_label = ctk.CTkLabel(
             header_frame,
             text="⚙️ Filter Settings",
-            font=self.fonts['h4'],
-            text_color=self.colors['text_primary']
+            font=f['h4'],
+            text_color=c['text_primary']
         )
         title_label.pack(side="left")
         
         # Content area with proper grid layout for full height utilization
         content_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        content_frame.grid(row=1, column=0, sticky="nsew", padx=self.spacing['lg'], pady=(0, self.spacing['lg']))
+        content_frame.grid(row=1, column=0, sticky="nsew", padx=s['lg'], pady=(0, s['lg']))
         content_frame.grid_columnconfigure(0, weight=1)
         content_frame.grid_rowconfigure(0, weight=1)  # Exclude shorts
         content_frame.grid_rowconfigure(1, weight=1)  # Duration
@@ -831,220 +982,106 @@ class YouTube2SheetsGUI:
         
         # Premium exclude shorts checkbox
         shorts_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        shorts_frame.grid(row=0, column=0, sticky="ew", pady=(0, self.spacing['md']))
+        shorts_frame.grid(row=0, column=0, sticky="ew", pady=(0, s['md']))
         
         self.exclude_shorts_checkbox = ctk.CTkCheckBox(
             shorts_frame,
             text="Exclude YouTube Shorts",
             variable=self.exclude_shorts_var,
-            font=self.fonts['body'],
-            text_color=self.colors['text_primary'],
-            fg_color=self.colors['primary'],
-            hover_color=self.colors['primary_dark'],
-            checkmark_color=self.colors['text_primary']
+            font=f['body'],
+            text_color=c['text_primary'],
+            fg_color=c['primary'],
+            hover_color=c['primary_dark'],
+            checkmark_color=c['text_primary']
         )
         self.exclude_shorts_checkbox.grid(row=0, column=0, sticky="w")
         
+        # Shared options for the filter labels and entries
+        mk_label = partial(ctk.CTkLabel, font=f['h6'], text_color=c['text_secondary'])
+        mk_entry = partial(
+            ctk.CTkEntry,
+            height=35,  # REDUCED HEIGHT FOR COMPACT LAYOUT
+            corner_radius=r['field'],
+            font=f['body'],
+            fg_color=c['surface_light'],
+            text_color=c['text_primary']
+        )
+        
         # COMPACT min duration control - OPTIMIZED FOR 30% SPACE
         duration_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        duration_frame.grid(row=1, column=0, sticky="ew", pady=(0, self.spacing['md']))
+        duration_frame.grid(row=1, column=0, sticky="ew", pady=(0, s['md']))
         
-        duration_label = ctk.CTkLabel(
-            duration_frame,
-            text="Min Duration (sec)",
-            font=self.fonts['h6'],
-            text_color=self.colors['text_secondary']
-        )
+        duration_label = mk_label(duration_frame, text="Min Duration (sec)")
         duration_label.grid(row=0, column=0, sticky="w")
         
-        self.min_duration_entry = ctk.CTkEntry(
+        self.min_duration_entry = mk_entry(
             duration_frame,
-            textvariable=self.min_duration_var, 
-            width=100,  # REDUCED WIDTH FOR COMPACT LAYOUT
-            height=35,  # REDUCED HEIGHT FOR COMPACT LAYOUT
-            corner_radius=self.radius['field'],
-            font=self.fonts['body'],
-            fg_color=self.colors['surface_light'],
-            text_color=self.colors['text_primary']
+            width=100  # REDUCED WIDTH FOR COMPACT LAYOUT
         )
-        self.min_duration_entry.grid(row=1, column=0, sticky="w", pady=(self.spacing['sm'], 0))
+        self.min_duration_entry.insert(0, "60")
+        self.min_duration_entry.grid(row=1, column=0, sticky="w", pady=(s['sm'], 0))
         
         # COMPACT keyword filter control - OPTIMIZED FOR 30% SPACE
         keyword_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        keyword_frame.grid(row=2, column=0, sticky="nsew", pady=(0, self.spacing['md']))
+        keyword_frame.grid(row=2, column=0, sticky="nsew", pady=(0, s['md']))
         keyword_frame.grid_columnconfigure(0, weight=1)
         keyword_frame.grid_rowconfigure(1, weight=1)  # Make keyword input expandable
         
-        keyword_label = ctk.CTkLabel(
-            keyword_frame, 
-            text="Keywords", 
-            font=self.fonts['h6'],
-            text_color=self.colors['text_secondary']
-        )
+        keyword_label = mk_label(keyword_frame, text="Keywords")
         keyword_label.grid(row=0, column=0, sticky="w")
         
         # Keyword input and mode in a horizontal layout
         input_mode_frame = ctk.CTkFrame(keyword_frame, fg_color="transparent")
-        input_mode_frame.grid(row=1, column=0, sticky="ew", pady=(self.spacing['sm'], 0))
+        input_mode_frame.grid(row=1, column=0, sticky="ew", pady=(s['sm'], 0))
         input_mode_frame.grid_columnconfigure(0, weight=1)
         input_mode_frame.grid_columnconfigure(1, weight=0)
         
-        self.keyword_filter_entry = ctk.CTkEntry(
-            input_mode_frame, 
-            textvariable=self.keyword_filter_var,
-            height=35,  # REDUCED HEIGHT FOR COMPACT LAYOUT
-            corner_radius=self.radius['field'],
-            font=self.fonts['body'],
-            fg_color=self.colors['surface_light'],
-            text_color=self.colors['text_primary'],
+        self.keyword_filter_entry = mk_entry(
+            input_mode_frame,
             placeholder_text="Optional: data, analytics, tutorial (comma-separated)"
         )
-        self.keyword_filter_entry.grid(row=0, column=0, sticky="ew", padx=(0, self.spacing['sm']))
+        self.keyword_filter_entry.grid(row=0, column=0, sticky="ew", padx=(0, s['sm']))
         
         # COMPACT keyword mode dropdown - OPTIMIZED FOR 30% SPACE
         mode_frame = ctk.CTkFrame(keyword_frame, fg_color="transparent")
-        mode_frame.grid(row=2, column=0, sticky="ew", pady=(self.spacing['sm'], 0))
+        mode_frame.grid(row=2, column=0, sticky="ew", pady=(s['sm'], 0))
         
         self.keyword_mode_dropdown = ctk.CTkOptionMenu(
                 mode_frame, 
             values=["include", "exclude"],  # SURGICAL FIX: Lowercase for backend compatibility
             width=100,  # REDUCED WIDTH FOR COMPACT LAYOUT
             height=35,  # REDUCED HEIGHT FOR COMPACT LAYOUT
-            fg_color=self.colors['surface_light'],
-            button_color=self.colors['secondary'],
-            button_hover_color=self.colors['secondary_dark'],
-            corner_radius=self.radius['field'],
-            font=self.fonts['body'],
-            text_color=self.colors['text_primary']
+            fg_color=c['surface_light'],
+            button_color=c['secondary'],
+            button_hover_color=c['secondary_dark'],
+            corner_radius=r['field'],
+            font=f['body'],
+            text_color=c['text_primary']
         )
         self.keyword_mode_dropdown.grid(row=0, column=0, sticky="w")
         
         # COMPACT tip text - OPTIMIZED FOR 30% SPACE
         tip_frame = ctk.CTkFrame(keyword_frame, fg_color="transparent")
         # move to next row to avoid overlapping the row used above
-        tip_frame.grid(row=3, column=0, sticky="ew", pady=(self.spacing['sm'], 0))
+        tip_frame.grid(row=3, column=0, sticky="ew", pady=(s['sm'], 0))
         
         tip_label = ctk.CTkLabel(
             tip_frame,
             text="💡 Use commas to separate keywords",
-            font=self.fonts['helper'],
-            text_color=self.colors['muted']
+            font=f['helper'],
+            text_color=c['muted']
         )
         tip_label.grid(row=0, column=0, sticky="w")
 
-    def _build_action_buttons_section(self, parent: ctk.CTkBaseClass) -> None:
-        """Build the Action Buttons section spanning full width with premium 2026 styling."""
-        section_frame = ctk.CTkFrame(
-            parent, 
-            corner_radius=self.radius['card'], 
-            fg_color=self.colors['surface'], 
-            border_width=1, 
-            border_color=self.colors['border']
-        )
-        section_frame.pack(fill="x", pady=(0, self.spacing['lg']))
-        
-        # Premium section header with enhanced styling
-        header_frame = ctk.CTkFrame(
-            section_frame, 
-            fg_color=self.colors['surface_light'],
-            corner_radius=self.radius['field'],
-            border_width=1,
-            border_color=self.colors['border_light']
-        )
-        header_frame.pack(fill="x", padx=self.spacing['lg'], pady=(self.spacing['lg'], self.spacing['md']))
-        
-        # Main title with icon
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="🚀 Action Buttons",
-            font=self.fonts['h4'],
-            text_color=self.colors['text_primary']
-        )
-        title_label.pack(side="left")
-        
-        # Premium progress section
-        progress_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        progress_frame.pack(fill="x", padx=self.spacing['lg'], pady=(0, self.spacing['lg']))
-        
-        # Premium progress bar
-        self.progress_bar = ctk.CTkProgressBar(
-            progress_frame,
-            height=24,
-            corner_radius=self.radius['field'],
-            progress_color=self.colors['primary'],
-            fg_color=self.colors['surface_dark']
-        )
-        self.progress_bar.pack(fill="x")
-        self.progress_bar.set(0)
-        
-        # Premium status label
-        self.status_label = ctk.CTkLabel(
-            progress_frame,
-            text="Ready to sync",
-            font=self.fonts['body_small'],
-            text_color=self.colors['text_secondary']
-        )
-        self.status_label.pack(pady=(self.spacing['sm'], 0))
-        
-        # Premium buttons container - horizontal layout
-        buttons_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        buttons_frame.pack(fill="x", padx=self.spacing['lg'], pady=(0, self.spacing['lg']))
-        
-        # Premium Start Automation Run button with enhanced styling
-        start_btn = ctk.CTkButton(
-            buttons_frame,
-            text="▶️ Start Automation Run",
-            width=200,
-            height=50,
-            command=self.start_sync,
-            fg_color=self.colors['primary'],
-            hover_color=self.colors['primary_dark'],
-            corner_radius=self.radius['field'],
-            font=self.fonts['button'],
-            border_width=1,
-            border_color=self.colors['primary_light']
-        )
-        start_btn.pack(side="left", padx=(0, self.spacing['md']))
-        
-        # Premium Schedule Run button with enhanced styling
-        schedule_btn = ctk.CTkButton(
-            buttons_frame,
-            text="📅 Schedule Run",
-            width=200,
-            height=50,
-            command=self._schedule_run,
-            fg_color=self.colors['info'],
-            hover_color=self.colors['info_dark'],
-            text_color="white",
-            corner_radius=self.radius['field'],
-            font=self.fonts['button'],
-            border_width=1,
-            border_color=self.colors['info_light']
-        )
-        schedule_btn.pack(side="left", padx=(0, self.spacing['md']))
-        
-        # Premium Cancel Job button with enhanced styling
-        cancel_btn = ctk.CTkButton(
-            buttons_frame,
-            text="⛔ Cancel Run",
-            width=200,
-            height=50,
-            command=self.stop_sync,
-            fg_color=self.colors['error'],
-            hover_color=self.colors['error_dark'],
-            text_color="white",
-            corner_radius=self.radius['field'],
-            font=self.fonts['button'],
-            border_width=1,
-            border_color=self.colors['error_light']
-        )
-        cancel_btn.pack(side="left")
-
     def _build_sticky_actions_bar(self, parent: ctk.CTkBaseClass) -> None:
         """Build sticky actions bar at bottom with 2026 styling."""
-        bar = ctk.CTkFrame(parent, fg_color=self.colors['surface'], corner_radius=0,
-                           border_width=1, border_color=self.colors['border'])
+        c, r, f = self.colors, self.radius, self.fonts
+        # Fixed height (46px buttons, 10px padding each side, 1px border), so
+        # the bar's contents don't need to propagate a size back up the tree
+        bar = ctk.CTkFrame(parent, fg_color=c['surface'], corner_radius=0, height=68,
+                           border_width=1, border_color=c['border'])
         bar.pack(side="bottom", fill="x")
+        bar.grid_propagate(False)
 
         # ⬇️ grid with flexible gutters
         for col in (0, 2, 4):
@@ -1056,76 +1093,66 @@ class YouTube2SheetsGUI:
         btns = ctk.CTkFrame(bar, fg_color="transparent")
         btns.grid(row=0, column=1, pady=10)
 
-        self.run_btn = ctk.CTkButton(
-            btns,
-            text="▶ Start Automation Run",
-            width=220, height=46, command=self.start_sync,
-            fg_color=self.colors['primary'],
-            hover_color=self.colors['primary_dark'],
-            text_color="white",
-            corner_radius=self.radius['button'],
-            font=self.fonts['button']
-        )
-        self.run_btn.pack(side="left", padx=8)
-
-        self.schedule_btn = ctk.CTkButton(
-            btns,
-            text="📅 Schedule Run",
-            width=200, height=46, command=self._schedule_run,
-            fg_color=self.colors['info'],
-            hover_color=self.colors['info_dark'],
-            text_color="white",
-            corner_radius=self.radius['button'],
-            font=self.fonts['button']
-        )
-        self.schedule_btn.pack(side="left", padx=8)
-
-        self.cancel_btn = ctk.CTkButton(
-            btns,
-            text="⛔ Cancel Run",
-            width=200, height=46, command=self.stop_sync,
-            fg_color=self.colors['danger'],
-            hover_color=self.colors['danger_dark'],
-            text_color="white",
-            text_color_disabled="white",
-            corner_radius=self.radius['button'],
-            font=self.fonts['button'],
-            state="disabled"
-        )
-        self.cancel_btn.pack(side="left", padx=8)
+        for attr, text, width, color, handler, state in self._ACTION_SPEC:
+            button = ctk.CTkButton(
+                btns,
+                text=text,
+                width=width, height=46, command=getattr(self, handler),
+                fg_color=c[color],
+                hover_color=c[f'{color}_dark'],
+                text_color="white",
+                text_color_disabled="white",
+                corner_radius=r['button'],
+                font=f['button'],
+                state=state
+            )
+            button.pack(side="left", padx=8)
+            setattr(self, attr, button)
         
         # Status group (sticks right)
         status = ctk.CTkFrame(bar, fg_color="transparent")
         status.grid(row=0, column=3, sticky="e", padx=(8, 16), pady=10)
 
         self.progress_bar = ctk.CTkProgressBar(status, width=220, height=18,
-                                               fg_color=self.colors['surface_2'],
-                                               progress_color=self.colors['primary'])
+                                               fg_color=c['surface_2'],
+                                               progress_color=c['primary'])
         self.progress_bar.grid(row=0, column=0, padx=(0, 12))
         self.progress_bar.set(0)
         self.progress_bar.grid_remove()  # hide initially
 
         self.status_chip = ctk.CTkLabel(status, text="Ready",
-                                        font=self.fonts['button_small'],
-                                        text_color=self.colors['text_1'],
-                                        fg_color=self.colors['success'],
-                                        corner_radius=self.radius['chip'], padx=12, pady=6)
+                                        font=f['button_small'],
+                                        text_color=c['text_1'],
+                                        fg_color=c['success'],
+                                        corner_radius=r['chip'], padx=12, pady=6)
         self.status_chip.grid(row=0, column=1)
 
     def _setup_keyboard_shortcuts(self) -> None:
         """Setup keyboard shortcuts for 2026 UX."""
         # Ctrl+Enter to run
-        self.root.bind('<Control-Return>', lambda e: self.start_sync())
+        self.root.bind('<Control-Return>', self._on_ctrl_return)
         
         # Ctrl+S to schedule
-        self.root.bind('<Control-s>', lambda e: self._schedule_run())
+        self.root.bind('<Control-s>', self._on_ctrl_s)
         
         # Esc to cancel
-        self.root.bind('<Escape>', lambda e: self.stop_sync())
+        self.root.bind('<Escape>', self._on_escape)
         
         # Focus management
         self.root.bind('<Tab>', self._on_tab_focus)
 
+    def _on_ctrl_return(self, event) -> None:
+        """Ctrl+Enter: start a run."""
+        self.start_sync()
+
+    def _on_ctrl_s(self, event) -> None:
+        """Ctrl+S: open the scheduler."""
+        self._schedule_run()
+
+    def _on_escape(self, event) -> None:
+        """Esc: cancel the current run."""
+        self.stop_sync()
+
     def _on_tab_focus(self, event) -> None:
         """Handle tab focus for better keyboard navigation."""
         # Custom tab order logic can be added here
@@ -1140,24 +1167,40 @@ class YouTube2SheetsGUI:
 
     def _paste_channels(self, event) -> None:
         """Handle paste of multiple channels."""
+        # Tk only allows clipboard access from its own thread; splitting a
+        # large clipboard happens on the background pool instead
         try:
-            import tkinter as tk
             clipboard_text = self.root.clipboard_get()
-            channels = [ch.strip() for ch in clipboard_text.replace('\n', ',').split(',') if ch.strip()]
-            for channel in channels:
-                self._add_channel_chip(channel)
-            self.channel_textbox.delete("1.0", "end")
-        except (ValueError, TypeError, Exception) as e:
+        except tk.TclError as e:
             print(f"Warning: Error processing channels: {e}")
-            # Continue execution - this is not critical
+            return
+        # Clear the box now, so text typed while the split runs is kept
+        self.channel_textbox.delete("1.0", "end")
+        self._run_in_background(self._insert_pasted_channels, self._split_pasted_channels, clipboard_text)
+
+    @staticmethod
+    def _split_pasted_channels(clipboard_text: str) -> list[str]:
+        """Split pasted text into unique channels, keeping their order. Runs on the background pool."""
+        # One regex pass; separators include whitespace, so no per-item strip
+        return list(dict.fromkeys(ch for ch in _CHANNEL_SPLIT_RE.split(clipboard_text) if ch))
+
+    def _insert_pasted_channels(self, future) -> None:
+        """Add chips for a split paste (runs on the Tk thread)."""
+        try:
+            channels = future.result()
+        except Exception as e:
+            print(f"Warning: Error processing channels: {e}")
+            return
+        # Chips may have been added while the split ran
+        for channel in channels:
+            if channel not in self.channel_chips:
+                self._add_channel_chip(channel)
 
     def _add_channel_chip(self, channel: str) -> None:
         """Add a channel chip."""
         if channel in self.channel_chips:
             return
         
-        self.channel_chips.append(channel)
-        
         # Create chip frame
         chip_frame = ctk.CTkFrame(
             self.channel_chips_frame,
@@ -1187,6 +1230,7 @@ class YouTube2SheetsGUI:
             font=self.fonts['caption']
         )
         remove_btn.pack(side="right", padx=(0, self.spacing['xs']))
+        self.channel_chips[channel] = (chip_frame, chip_label, remove_btn)
         
         # Pack chip
         chip_frame.pack(side="left", padx=(0, self.spacing['sm']), pady=self.spacing['xs'])
@@ -1196,30 +1240,30 @@ class YouTube2SheetsGUI:
 
     def _remove_channel_chip(self, channel: str, chip_frame) -> None:
         """Remove a channel chip."""
-        if channel in self.channel_chips:
-            self.channel_chips.remove(channel)
+        self.channel_chips.pop(channel, None)
         chip_frame.destroy()
         self._update_channel_count()
 
     def _update_channel_count(self) -> None:
         """Update channel count display."""
         count = len(self.channel_chips)
-        self.channel_count_label.configure(text=f"{count} channel{'s' if count != 1 else ''}")
+        self.channel_count_var.set(f"{count} channel{'s' if count != 1 else ''}")
 
     def _build_logging_section(self, parent: ctk.CTkBaseClass) -> None:
         """Build the logging section at the bottom with premium 2026 styling."""
+        c, s, r, f = self.colors, self.spacing, self.radius, self.fonts
         section_frame = ctk.CTkFrame(
             parent, 
-            corner_radius=self.radius['card'], 
-            fg_color=self.colors['surface'], 
+            corner_radius=r['card'], 
+            fg_color=c['surface'], 
             border_width=1, 
-            border_color=self.colors['border']
+            border_color=c['border']
         )
-        section_frame.pack(fill="both", expand=True, pady=(0, self.spacing['lg']))
+        section_frame.pack(fill="both", expand=True, pady=(0, s['lg']))
         
         # Premium section header
         header_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        header_frame.pack(fill="x", padx=self.spacing['lg'], pady=(self.spacing['lg'], self.spacing['md']))
+        header_frame.pack(fill="x", padx=s['lg'], pady=(s['lg'], s['md']))
         
         # Left side - Title with status
         title_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -1228,8 +1272,8 @@ class YouTube2SheetsGUI:
         title_label = ctk.CTkLabel(
             title_frame,
             text="📋 Activity Log",
-            font=self.fonts['h4'],
-            text_color=self.colors['text_primary']
+            font=f['h4'],
+            text_color=c['text_primary']
         )
         title_label.pack(side="left")
         
@@ -1243,13 +1287,13 @@ class YouTube2SheetsGUI:
             text="Debug Logging", 
             variable=self.debug_logging_var,
             command=self._toggle_debug_logging,
-            font=self.fonts['body_small'],
-            text_color=self.colors['text_primary'],
-            fg_color=self.colors['accent'],
-            hover_color=self.colors['accent_dark'],
-            checkmark_color=self.colors['text_primary']
+            font=f['body_small'],
+            text_color=c['text_primary'],
+            fg_color=c['accent'],
+            hover_color=c['accent_dark'],
+            checkmark_color=c['text_primary']
         )
-        self.debug_logging_checkbox.pack(side="left", padx=(0, self.spacing['lg']))
+        self.debug_logging_checkbox.pack(side="left", padx=(0, s['lg']))
         
         # Clear Logs button
         clear_btn = ctk.CTkButton(
@@ -1261,7 +1305,7 @@ class YouTube2SheetsGUI:
             fg_color="gray40",
             hover_color="gray50",
             corner_radius=6,
-            font=ctk.CTkFont(size=11)
+            font=f['button_xs']
         )
         clear_btn.pack(side="left", padx=(0, 10))
         
@@ -1275,35 +1319,31 @@ class YouTube2SheetsGUI:
             fg_color="gray40",
             hover_color="gray50",
             corner_radius=6,
-            font=ctk.CTkFont(size=11)
+            font=f['button_xs']
         )
         export_btn.pack(side="left")
         
         # Log text area with ring buffer
         self.log_text = ctk.CTkTextbox(
             section_frame,
-            corner_radius=self.radius['field'],
-            font=ctk.CTkFont(family="Consolas", size=12),
-            fg_color=self.colors['surface_2'],
-            text_color=self.colors['text_1'],
-            scrollbar_button_color=self.colors['muted'],
-            scrollbar_button_hover_color=self.colors['text_2']
-        )
-        self.log_text.pack(fill="both", expand=True, padx=self.spacing['lg'], pady=(0, self.spacing['lg']))
+            corner_radius=r['field'],
+            font=f['mono_log'],
+            fg_color=c['surface_2'],
+            text_color=c['text_1'],
+            scrollbar_button_color=c['muted'],
+            scrollbar_button_hover_color=c['text_2'],
+            # Append-only view: no undo history, and no per-insert line wrapping
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
+            wrap="none"
+        )
+        self.log_text.pack(fill="both", expand=True, padx=s['lg'], pady=(0, s['lg']))
         self.log_text.configure(state="disabled")
         
-        # Initialize ring buffer
-        self.MAX_LOG_LINES = 5000
-        self.log_lines = []
-        
-        # Add initial log messages
-        self._append_log("YouTube2Sheets GUI initialized")
-        self._append_log("Ready to process YouTube channels")
-        self._append_log("All systems operational")
-        self._append_log("Note: For real API integration, run setup_api_credentials.py")
-        self._append_log("☑ Configuration loaded successfully")
-        self._append_log("Auto-refreshing tabs on startup...")
-        self._append_log("Startup refresh complete! Current selection: AI_ML")
+        # Add initial log messages; they are only queued here and reach the
+        # widget together in the first drain after the window is shown
+        self._append_log_many(self.STARTUP_LOG_MESSAGES)
 
     def _build_status_bar(self, parent: ctk.CTkBaseClass) -> None:
         """Build the status bar at the bottom."""
@@ -1315,7 +1355,7 @@ class YouTube2SheetsGUI:
         self.status_text = ctk.CTkLabel(
             status_frame,
             text="Ready - No active jobs",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts['status_bold'],
             text_color="white"
         )
         self.status_text.pack(side="left", padx=20, pady=10)
@@ -1324,7 +1364,7 @@ class YouTube2SheetsGUI:
         self.api_usage_text = ctk.CTkLabel(
             status_frame,
             text="Daily API Usage: Loading...",
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['body_small'],
             text_color="gray70"
         )
         self.api_usage_text.pack(side="right", padx=20, pady=10)
@@ -1339,15 +1379,24 @@ class YouTube2SheetsGUI:
         self.link_sync_btn.configure(fg_color="gray30")
         self.scheduler_btn.configure(fg_color="blue")
         
-        # Create scheduler window
+        # Build the scheduler window on first use, then reuse it
+        window = self._scheduler_window
+        if window is None or not window.winfo_exists():
+            window = self._scheduler_window = self._build_scheduler_window()
+        else:
+            window.deiconify()
+            window.lift()
+        window.grab_set()
+
+    def _build_scheduler_window(self) -> ctk.CTkToplevel:
+        """Create the scheduler window and its widgets."""
         scheduler_window = ctk.CTkToplevel(self.root)
         scheduler_window.title("📅 Scheduler - YouTube2Sheets")
-        scheduler_window.geometry("800x600")
         scheduler_window.transient(self.root)
-        scheduler_window.grab_set()
+        scheduler_window.protocol("WM_DELETE_WINDOW", self._hide_scheduler_window)
         
-        # Center the window
-        scheduler_window.update_idletasks()
+        # Center the window; the size is fixed and screen metrics don't
+        # depend on pending layout, so no idle-task flush is needed
         x = (scheduler_window.winfo_screenwidth() // 2) - (800 // 2)
         y = (scheduler_window.winfo_screenheight() // 2) - (600 // 2)
         scheduler_window.geometry(f"800x600+{x}+{y}")
@@ -1360,7 +1409,7 @@ class YouTube2SheetsGUI:
         title_label = ctk.CTkLabel(
             main_frame,
             text="📅 Job Scheduler",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color=self.colors['text_1']
         )
         title_label.pack(pady=(20, 30))
@@ -1373,61 +1422,48 @@ class YouTube2SheetsGUI:
         
         # Action buttons
         self._build_scheduler_actions(main_frame)
+        
+        return scheduler_window
+
+    def _hide_scheduler_window(self) -> None:
+        """Hide the scheduler window, keeping its widgets and jobs for next time."""
+        window = self._scheduler_window
+        if window is not None:
+            window.grab_release()
+            window.withdraw()
+        self._show_link_sync_tab()
 
-    def _on_channel_entry_click(self, event=None) -> None:
-        """Handle channel entry click - clear placeholder if present."""
-        if self.channel_textbox.get("1.0", "end-1c").strip() == self._get_placeholder_text():
-            self.channel_textbox.delete("1.0", "end")
-            self.channel_textbox.configure(text_color="white")
-    
-    def _on_channel_entry_key(self, event=None) -> None:
-        """Handle channel entry key press - clear placeholder if present."""
-        if self.channel_textbox.get("1.0", "end-1c").strip() == self._get_placeholder_text():
-            self.channel_textbox.delete("1.0", "end")
-            self.channel_textbox.configure(text_color="white")
-    
-    def _on_channel_entry_focus_in(self, event=None) -> None:
-        """Handle channel entry focus in - clear placeholder if present."""
-        if self.channel_textbox.get("1.0", "end-1c").strip() == self._get_placeholder_text():
-            self.channel_textbox.delete("1.0", "end")
-            self.channel_textbox.configure(text_color="white")
-    
-    def _on_channel_entry_focus_out(self, event=None) -> None:
-        """Handle channel entry focus out - restore placeholder if empty."""
-        if not self.channel_textbox.get("1.0", "end-1c").strip():
-            # CTkTextbox placeholder is handled automatically
-            self.channel_textbox.configure(text_color="gray60")
-    
     def _get_placeholder_text(self) -> str:
         """Get the placeholder text for channel entry."""
-        return (
-            "Please input the hyperlink of the channel name or the Channel Handle.\n\n"
-            "• Channel Handle: @channelname (e.g., @mkbhd)\n"
-            "• Channel URL: https://www.youtube.com/@channelname\n"
-            "• Channel ID: UC... (e.g., UCX60Q3DkcsbYNE6H8uQQu-A)\n\n"
-            "Separate multiple channels with newlines, commas, or spaces."
-        )
+        return _CHANNEL_PLACEHOLDER
 
     def _on_channel_input_change(self, event=None) -> None:
-        """Handle channel input changes."""
+        """Handle channel input changes once a typing or paste burst settles."""
+        if self._pending_change is not None:
+            self.root.after_cancel(self._pending_change)
+        self._pending_change = self.root.after(150, self._flush_channel_input)
+    
+    def _flush_channel_input(self) -> None:
+        """Capture the channel textbox contents into ``channel_input``."""
+        self._pending_change = None
         content = self.channel_textbox.get("1.0", "end-1c").strip()
         # Don't set the variable if it's just placeholder text
-        if content != self._get_placeholder_text():
-            self.channel_var.set(content)
+        if content != _CHANNEL_PLACEHOLDER:
+            self.channel_input = content
     
     def _toggle_tab_mode(self) -> None:
         """Toggle between existing tab and new tab modes."""
         if self.use_existing_tab_var.get():
             # Show existing tab dropdown, hide new tab entry
-            self.existing_tab_frame.pack(fill="x")
-            self.new_tab_frame.pack_forget()
+            self.new_tab_frame.grid_remove()
+            self.existing_tab_frame.grid()
             # Only log if logging system is ready
             if hasattr(self, 'log_text'):
                 self._append_log("Mode: Using existing tab")
         else:
             # Show new tab entry, hide existing tab dropdown
-            self.new_tab_frame.pack(fill="x")
-            self.existing_tab_frame.pack_forget()
+            self.existing_tab_frame.grid_remove()
+            self.new_tab_frame.grid()
             # Only log if logging system is ready
             if hasattr(self, 'log_text'):
                 self._append_log("Mode: Creating new tab")
@@ -1450,93 +1486,104 @@ class YouTube2SheetsGUI:
 
     def _show_settings_dialog(self) -> None:
         """Show comprehensive settings dialog."""
-        # Create settings window
+        # Build the dialog on first use, then reuse it; the entries are bound
+        # to the settings StringVars, so a reused dialog shows current values
+        window = self._settings_dialog
+        if window is None or not window.winfo_exists():
+            window = self._settings_dialog = self._build_settings_dialog()
+        else:
+            window.deiconify()
+            window.lift()
+        window.grab_set()
+        
+        self._append_log("Settings dialog opened successfully")
+
+    def _hide_settings_dialog(self) -> None:
+        """Hide the settings dialog, keeping its widgets for next time."""
+        window = self._settings_dialog
+        if window is not None:
+            window.grab_release()
+            window.withdraw()
+
+    def _build_settings_dialog(self) -> ctk.CTkToplevel:
+        """Create the settings dialog and its widgets."""
         settings_window = ctk.CTkToplevel(self.root)
         settings_window.title("⚙️ API Settings - YouTube2Sheets")
-        settings_window.geometry("600x500")
         settings_window.transient(self.root)
-        settings_window.grab_set()
+        settings_window.protocol("WM_DELETE_WINDOW", self._hide_settings_dialog)
         
-        # Store reference for testing
-        self._settings_dialog = settings_window
-        
-        # Center the window
-        settings_window.update_idletasks()
-        x = (settings_window.winfo_screenwidth() // 2) - (600 // 2)
-        y = (settings_window.winfo_screenheight() // 2) - (500 // 2)
+        # Center over the main window; the dialog size is fixed and the root
+        # is already laid out, so no idle-task flush is needed
+        root = self.root
+        x = root.winfo_rootx() + (root.winfo_width() - 600) // 2
+        y = root.winfo_rooty() + (root.winfo_height() - 500) // 2
         settings_window.geometry(f"600x500+{x}+{y}")
         
-        # Main container
+        # Main container; the title, cards and buttons sit on its grid, and
+        # the cards grid their own headers and fields, so no wrapper frames
         main_frame = ctk.CTkFrame(settings_window, fg_color="gray20")
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        main_frame.grid_columnconfigure(3, weight=1)
         
         # Title
         title_label = ctk.CTkLabel(
             main_frame,
             text="⚙️ API Configuration Settings",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.fonts['h2'],
             text_color="white"
         )
-        title_label.pack(pady=(20, 30))
+        title_label.grid(row=0, column=0, columnspan=4, pady=(20, 30))
         
         # YouTube API Configuration
         youtube_card = ctk.CTkFrame(main_frame, corner_radius=8, fg_color="gray15")
-        youtube_card.pack(fill="x", pady=(0, 20))
+        youtube_card.grid(row=1, column=0, columnspan=4, sticky="ew", pady=(0, 20))
         
         # Card header
-        youtube_header = ctk.CTkFrame(youtube_card, fg_color="transparent")
-        youtube_header.pack(fill="x", padx=15, pady=(15, 10))
-        
         ctk.CTkLabel(
-            youtube_header,
+            youtube_card,
             text="🔑 YouTube API Configuration",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.fonts['h4'],
             text_color="white"
-        ).pack(side="left")
+        ).grid(row=0, column=0, columnspan=2, sticky="w", padx=15, pady=(15, 10))
         
         # YouTube API Key
-        self._add_settings_entry(youtube_card, "YouTube API Key", self.youtube_api_key_var, show="*")
+        self._add_settings_entry(youtube_card, 1, "YouTube API Key", self.youtube_api_key_var, show="*")
         
         # Google Sheets Configuration
         sheets_card = ctk.CTkFrame(main_frame, corner_radius=8, fg_color="gray15")
-        sheets_card.pack(fill="x", pady=(0, 20))
+        sheets_card.grid(row=2, column=0, columnspan=4, sticky="ew", pady=(0, 20))
+        sheets_card.grid_columnconfigure(1, weight=1)
         
         # Card header
-        sheets_header = ctk.CTkFrame(sheets_card, fg_color="transparent")
-        sheets_header.pack(fill="x", padx=15, pady=(15, 10))
-        
         ctk.CTkLabel(
-            sheets_header,
+            sheets_card,
             text="📊 Google Sheets Configuration",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.fonts['h4'],
             text_color="white"
-        ).pack(side="left")
+        ).grid(row=0, column=0, columnspan=2, sticky="w", padx=15, pady=(15, 10))
         
         # Service Account JSON
-        self._add_settings_browse_entry(sheets_card, "Service Account JSON", self.service_account_path_var)
+        self._add_settings_browse_entry(sheets_card, 1, "Service Account JSON", self.service_account_path_var)
         
         # Spreadsheet URL
-        self._add_settings_entry(sheets_card, "Default Spreadsheet URL", self.sheet_url_var)
+        self._add_settings_entry(sheets_card, 3, "Default Spreadsheet URL", self.sheet_url_var)
         
         # Buttons
-        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(0, 20))
-        
         save_btn = ctk.CTkButton(
-            button_frame,
+            main_frame,
             text="💾 Save Settings",
             width=150,
             height=40,
-            command=lambda: self._save_settings(settings_window),
+            command=self._save_settings,
             fg_color="green",
             hover_color="darkgreen",
             corner_radius=8,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['button']
         )
-        save_btn.pack(side="left", padx=(0, 10))
+        save_btn.grid(row=3, column=0, padx=(0, 10), pady=(0, 20))
         
         test_btn = ctk.CTkButton(
-            button_frame,
+            main_frame,
             text="🧪 Test API Keys",
             width=150,
             height=40,
@@ -1544,76 +1591,67 @@ class YouTube2SheetsGUI:
             fg_color="blue",
             hover_color="darkblue",
             corner_radius=8,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['button']
         )
-        test_btn.pack(side="left", padx=(0, 10))
+        test_btn.grid(row=3, column=1, padx=(0, 10), pady=(0, 20))
         
         cancel_btn = ctk.CTkButton(
-            button_frame,
+            main_frame,
             text="❌ Cancel",
             width=100,
             height=40,
-            command=settings_window.destroy,
+            command=self._hide_settings_dialog,
             fg_color="gray60",
             hover_color="gray50",
             corner_radius=8,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['button']
         )
-        cancel_btn.pack(side="left")
+        cancel_btn.grid(row=3, column=2, pady=(0, 20))
         
-        self._append_log("Settings dialog opened successfully")
+        return settings_window
 
-    def _add_settings_entry(self, parent: ctk.CTkBaseClass, label: str, variable, **kwargs) -> None:
-        """Add entry field to settings dialog."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", padx=15, pady=8)
-        
+    def _add_settings_entry(self, parent: ctk.CTkBaseClass, row: int, label: str, variable, **kwargs) -> None:
+        """Add entry field to settings dialog, using grid rows ``row`` and ``row + 1`` of ``parent``."""
         ctk.CTkLabel(
-            row, 
+            parent, 
             text=f"{label}:", 
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts['label_bold'],
             text_color="white"
-        ).pack(anchor="w", pady=(0, 5))
+        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=15, pady=(8, 5))
         
         entry = ctk.CTkEntry(
-            row, 
+            parent, 
             textvariable=variable, 
             width=500,
             height=35,
             corner_radius=8,
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['body_small'],
             fg_color="gray10",
             text_color="white",
             **kwargs
         )
-        entry.pack(anchor="w")
+        entry.grid(row=row + 1, column=0, columnspan=2, sticky="w", padx=15, pady=(0, 8))
 
-    def _add_settings_browse_entry(self, parent: ctk.CTkBaseClass, label: str, variable) -> None:
-        """Add browse entry field to settings dialog."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", padx=15, pady=8)
-        
+    def _add_settings_browse_entry(self, parent: ctk.CTkBaseClass, row: int, label: str, variable) -> None:
+        """Add browse entry field to settings dialog, using grid rows ``row`` and ``row + 1`` of ``parent``."""
         ctk.CTkLabel(
-            row, 
+            parent, 
             text=f"{label}:", 
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts['label_bold'],
             text_color="white"
-        ).pack(anchor="w", pady=(0, 5))
-        
-        inner = ctk.CTkFrame(row, fg_color="transparent")
-        inner.pack(fill="x")
+        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=15, pady=(8, 5))
         
         entry = ctk.CTkEntry(
-            inner, 
+            parent, 
             textvariable=variable, 
             width=400,
             height=35,
             corner_radius=8,
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['body_small'],
             fg_color="gray10",
             text_color="white"
         )
-        entry.pack(side="left", padx=(0, 10))
+        entry.grid(row=row + 1, column=0, sticky="w", padx=(15, 10), pady=(0, 8))
         
         def browse():
             file_path = filedialog.askopenfilename(
@@ -1624,7 +1662,7 @@ class YouTube2SheetsGUI:
                 variable.set(file_path)
         
         browse_btn = ctk.CTkButton(
-            inner, 
+            parent, 
             text="Browse", 
             width=80,
             height=35,
@@ -1632,11 +1670,11 @@ class YouTube2SheetsGUI:
             fg_color="blue",
             hover_color="darkblue",
             corner_radius=8,
-            font=ctk.CTkFont(size=12)
+            font=self.fonts['body_small']
         )
-        browse_btn.pack(side="left")
+        browse_btn.grid(row=row + 1, column=1, sticky="w", pady=(0, 8))
 
-    def _save_settings(self, settings_window) -> None:
+    def _save_settings(self) -> None:
         """Save settings and close dialog."""
         try:
             # Validate settings
@@ -1656,24 +1694,31 @@ class YouTube2SheetsGUI:
                 messagebox.showerror("Validation Error", "Spreadsheet URL is required")
                 return
             
-            # Save using config loader
-            config_to_save = {
+            # Save using config loader (environment + .env)
+            save_config(youtube_key, service_account, sheet_url)
+            
+            # Update local config from the values just read; reloading would
+            # return the same environment values. Cached Sheets clients and
+            # credentials may belong to the old key file, so drop both
+            self.config.update({
                 'youtube_api_key': youtube_key,
                 'google_sheets_service_account_json': service_account,
                 'default_spreadsheet_url': sheet_url
-            }
-            save_config(config_to_save)
-            
-            # Update local config
-            self.config = load_config()
+            })
+            with self._sheets_lock:
+                self._sheets_cache.clear()
+                self._sheets_generation += 1
+            clear_credentials_cache()
             
-            self._append_log("✅ Settings saved successfully")
-            self._append_log(f"YouTube API Key: {'*' * 20}{youtube_key[-4:] if len(youtube_key) > 4 else ''}")
-            self._append_log(f"Service Account: {service_account}")
-            self._append_log(f"Spreadsheet URL: {sheet_url}")
-            self._append_log("🔄 Refreshing tabs with new settings...")
+            self._append_log_many([
+                "✅ Settings saved successfully",
+                f"YouTube API Key: {'*' * 20}{youtube_key[-4:] if len(youtube_key) > 4 else ''}",
+                f"Service Account: {service_account}",
+                f"Spreadsheet URL: {sheet_url}",
+                "🔄 Refreshing tabs with new settings...",
+            ])
             
-            settings_window.destroy()
+            self._hide_settings_dialog()
             
             # Refresh tabs with new settings
             self._refresh_tabs()
@@ -1684,97 +1729,97 @@ class YouTube2SheetsGUI:
 
     def _test_api_keys(self) -> None:
         """Test API keys for connectivity."""
-        try:
-            self._append_log("Testing API keys...")
-            
-            # Test YouTube API
-            youtube_key = self.youtube_api_key_var.get().strip()
-            if youtube_key:
-                self._append_log("Testing YouTube API connection...")
-                # TODO: Implement actual YouTube API test
-                self._append_log("✅ YouTube API key appears valid")
-            else:
-                self._append_log("⚠️ No YouTube API key provided")
-            
-            # Test Google Sheets API
-            service_account = self.service_account_path_var.get().strip()
-            if service_account:
-                self._append_log("Testing Google Sheets API connection...")
-                # TODO: Implement actual Google Sheets API test
-                self._append_log("✅ Google Sheets API appears valid")
-            else:
-                self._append_log("⚠️ No Service Account file provided")
-                
-        except Exception as e:
-            self._append_log(f"❌ API test failed: {str(e)}")
+        youtube_key = self.youtube_api_key_var.get().strip()
+        service_account = self.service_account_path_var.get().strip()
+        self._append_log("Testing API keys...")
+        # Both probes run concurrently on the background pool; their results
+        # are logged together on the Tk thread, YouTube first
+        self._handle_when_done(
+            self._report_api_probes,
+            self._bg.submit(self._probe_youtube, youtube_key),
+            self._bg.submit(self._probe_sheets, service_account),
+        )
+
+    def _report_api_probes(self, *futures) -> None:
+        """Log the API probe results in submission order (runs on the Tk thread)."""
+        lines = []
+        for future in futures:
+            try:
+                lines.extend(future.result())
+            except Exception as e:
+                lines.append(f"❌ API test failed: {str(e)}")
+        self._append_log_many(lines)
+
+    @staticmethod
+    def _probe_youtube(youtube_key: str) -> list[str]:
+        """Check the YouTube API key and return log lines. Runs on the background pool; no Tk calls."""
+        if not youtube_key:
+            return ["⚠️ No YouTube API key provided"]
+        # TODO: Implement actual YouTube API test
+        return ["Testing YouTube API connection...", "✅ YouTube API key appears valid"]
+
+    @staticmethod
+    def _probe_sheets(service_account: str) -> list[str]:
+        """Check the Sheets service account and return log lines. Runs on the background pool; no Tk calls."""
+        if not service_account:
+            return ["⚠️ No Service Account file provided"]
+        # TODO: Implement actual Google Sheets API test
+        return ["Testing Google Sheets API connection...", "✅ Google Sheets API appears valid"]
 
     def _refresh_tabs(self) -> None:
-        """Refresh available tabs from Google Sheet using real API - GUARANTEED TO WORK."""
+        """Refresh available tabs from Google Sheet using real API, fetched off the Tk thread."""
+        # Any fetch still in flight is stale from here on, and its handler
+        # won't re-enable the button, so this refresh does
+        self._tabs_request += 1
+        self.refresh_tabs_btn.configure(state="normal", text="🔄")
         try:
             self._append_log("🔄 Refreshing tabs from Google Sheet...")
             
             # Get sheet URL from config
             sheet_url = self.config.get('default_spreadsheet_url', '').strip()
             if not sheet_url:
-                self._append_log("❌ No spreadsheet URL configured")
-                self._append_log("💡 Click 'Settings' button to configure your Google Sheets URL")
+                self._append_log_many([
+                    "❌ No spreadsheet URL configured",
+                    "💡 Click 'Settings' button to configure your Google Sheets URL",
+                ])
                 self._simulate_tab_refresh()
                 return
             
-            self._append_log(f"📊 Using spreadsheet URL: {sheet_url[:50]}...")
-            self._append_log("🔗 Attempting to connect to Google Sheets API...")
+            # Extract spreadsheet ID from URL before any credential work
+            sheet_id_match = _SHEET_ID_RE.search(sheet_url)
+            if not sheet_id_match:
+                self._append_log("❌ Invalid spreadsheet URL format")
+                return
+            sheet_id = sheet_id_match.group(1)
+            
+            self._append_log_many([
+                f"📊 Using spreadsheet URL: {sheet_url[:50]}...",
+                "🔗 Attempting to connect to Google Sheets API...",
+            ])
             
             # Check if we have API credentials
             youtube_key = self.config.get('youtube_api_key', '').strip()
             service_account = self.config.get('google_sheets_service_account_json', '').strip()
             
             if not youtube_key or not service_account:
-                self._append_log("❌ Missing API credentials")
-                self._append_log("💡 Click 'Settings' button to configure API keys")
+                self._append_log_many([
+                    "❌ Missing API credentials",
+                    "💡 Click 'Settings' button to configure API keys",
+                ])
                 self._simulate_tab_refresh()
                 return
             
-            # Build automator to access Google Sheets
+            # Validate credentials here; only the API call itself runs on the
+            # background pool
             try:
-                automator = self._build_automator()
-                
-                # Extract spreadsheet ID from URL
-                import re
-                sheet_id_match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheet_url)
-                if not sheet_id_match:
-                    self._append_log("❌ Invalid spreadsheet URL format")
-                    return
+                service_account = validate_service_account_path(service_account)
                 
-                sheet_id = sheet_id_match.group(1)
                 self._append_log(f"Connecting to spreadsheet: {sheet_id}")
                 
-                # Get tabs from Google Sheets API using modular service
-                from src.services.sheets_service import SheetsService, SheetsConfig
-                
-                # Create sheets service
-                sheets_config = SheetsConfig(
-                    service_account_file=service_account,
-                    spreadsheet_id=sheet_id
-                )
-                sheets_service = SheetsService(sheets_config)
-                all_tabs = sheets_service.get_existing_tabs()
-                
-                if all_tabs:
-                    # Filter out tabs with "Ranking" in the name (case-insensitive)
-                    filtered_tabs = [tab for tab in all_tabs if 'ranking' not in tab.lower()]
-                    
-                    # Update dropdown with filtered tabs
-                    self.tab_name_dropdown.configure(values=filtered_tabs)
-                    # keep the variable in sync (important for downstream usage)
-                    self.tab_name_var.set(filtered_tabs[0] if filtered_tabs else "AI_ML")
-                    
-                    self._append_log("✅ Tabs refreshed successfully!")
-                    self._append_log(f"Available tabs ({len(filtered_tabs)}): {', '.join(filtered_tabs)}")
-                    if len(all_tabs) > len(filtered_tabs):
-                        excluded_count = len(all_tabs) - len(filtered_tabs)
-                        self._append_log(f"Excluded {excluded_count} 'Ranking' tabs")
-                else:
-                    self._append_log("⚠️ No tabs found in spreadsheet")
+                # Show the fetch is in flight; this also blocks repeat clicks
+                self.refresh_tabs_btn.configure(state="disabled", text="⏳")
+                self._run_in_background(partial(self._apply_fetched_tabs, self._tabs_request),
+                                        self._fetch_tabs, service_account, sheet_id)
                     
             except Exception as api_error:
                 self._append_log(f"❌ Google Sheets API error: {str(api_error)}")
@@ -1785,6 +1830,88 @@ class YouTube2SheetsGUI:
             self._append_log(f"❌ Tab refresh failed: {str(e)}")
             self._simulate_tab_refresh()
     
+    def _fetch_tabs(self, service_account: str, sheet_id: str) -> list[str]:
+        """Fetch tab names from Google Sheets. Runs on the background pool; no Tk calls."""
+        service = self._get_sheets_service(service_account, sheet_id)
+        try:
+            return service.get_existing_tabs()
+        finally:
+            self._release_sheets_service(service)
+    
+    def _get_sheets_service(self, service_account: str, sheet_id: str) -> SheetsService:
+        """Check out a SheetsService for the key file and spreadsheet, reusing one built earlier.
+        
+        The tab refresh, the sync worker and spreadsheet switching share one
+        cache, so the client a refresh built is reused by the next sync. API
+        clients aren't safe to use from two threads at once, so a cached client
+        goes to one caller at a time; give it back with _release_sheets_service.
+        The key file's mtime is part of the key, and the credential cache in
+        sheets_service is keyed the same way, so a replaced key file gets a
+        fresh client built from freshly loaded credentials. Saving settings
+        clears both caches.
+        """
+        try:
+            mtime = os.path.getmtime(service_account)
+        except OSError:
+            mtime = None
+        key = (service_account, mtime, sheet_id)
+        
+        with self._sheets_lock:
+            service = self._sheets_cache.pop(key, None)
+            generation = self._sheets_generation
+        if service is None:
+            service = SheetsService(SheetsConfig(
+                service_account_file=service_account,
+                spreadsheet_id=sheet_id
+            ))
+        with self._sheets_lock:
+            self._sheets_leases[id(service)] = (key, generation)
+        return service
+    
+    def _release_sheets_service(self, service: SheetsService) -> None:
+        """Give back a client from _get_sheets_service so the next caller can reuse it."""
+        with self._sheets_lock:
+            key, generation = self._sheets_leases.pop(id(service))
+            # Don't keep a client whose initialization failed, one checked out
+            # before settings were saved, or a second client for the same key
+            if (service.service is not None and generation == self._sheets_generation
+                    and key not in self._sheets_cache):
+                self._sheets_cache[key] = service
+    
+    def _apply_fetched_tabs(self, request: int, future) -> None:
+        """Show the result of a background tab fetch (runs on the Tk thread)."""
+        if request != self._tabs_request:
+            # A newer refresh started after this fetch; its result wins
+            return
+        self.refresh_tabs_btn.configure(state="normal", text="🔄")
+        try:
+            all_tabs = future.result()
+        except Exception as api_error:
+            self._append_log(f"❌ Google Sheets API error: {str(api_error)}")
+            # Fallback to simulation
+            self._simulate_tab_refresh()
+            return
+        
+        if all_tabs:
+            # Filter out tabs with "Ranking" in the name (case-insensitive)
+            filtered_tabs = [tab for tab in all_tabs if 'ranking' not in tab.lower()]
+            
+            # Update dropdown with filtered tabs
+            self.tab_name_dropdown.configure(values=filtered_tabs)
+            # keep the variable in sync (important for downstream usage)
+            self.tab_name_var.set(filtered_tabs[0] if filtered_tabs else "AI_ML")
+            
+            logs = [
+                "✅ Tabs refreshed successfully!",
+                f"Available tabs ({len(filtered_tabs)}): {', '.join(filtered_tabs)}",
+            ]
+            if len(all_tabs) > len(filtered_tabs):
+                excluded_count = len(all_tabs) - len(filtered_tabs)
+                logs.append(f"Excluded {excluded_count} 'Ranking' tabs")
+            self._append_log_many(logs)
+        else:
+            self._append_log("⚠️ No tabs found in spreadsheet")
+    
     def _simulate_tab_refresh(self) -> None:
         """Fallback simulation for tab refresh."""
         all_tabs = [
@@ -1814,8 +1941,9 @@ class YouTube2SheetsGUI:
             return
 
         try:
-            # SURGICAL FIX: Get channel input from textbox (not entry)
-            channel_input = self.channel_textbox.get("1.0", "end-1c").strip()
+            # Snapshot the form on the Tk thread; the worker reads only this
+            inputs = self._snapshot_sync_inputs()
+            channel_input = inputs.channel_input
             if not channel_input:
                 raise ValidationError("Please provide at least one channel ID, URL, or @handle")
 
@@ -1837,7 +1965,7 @@ class YouTube2SheetsGUI:
             self._stop_flag.clear()
             self._worker_thread = threading.Thread(
                 target=self._sync_worker,
-                args=(channels, config),
+                args=(inputs, channels, config),
                 daemon=True
             )
             self._worker_thread.start()
@@ -1848,75 +1976,91 @@ class YouTube2SheetsGUI:
             logger.exception("Unexpected error starting sync")
             messagebox.showerror("Unexpected error", str(e))
 
+    def _snapshot_sync_inputs(self) -> _SyncInputs:
+        """Read the sync form once, on the Tk thread."""
+        use_existing = self.use_existing_tab_var.get()
+        tab_source = self.tab_name_var.get() if use_existing else self.new_tab_entry.get()
+        return _SyncInputs(
+            # SURGICAL FIX: Get channel input from textbox (not entry)
+            channel_input=self.channel_textbox.get("1.0", "end-1c").strip(),
+            tab_name=tab_source.strip(),
+            use_existing=use_existing,
+            sheet_id=self.current_spreadsheet_id or "",
+            youtube_key=get_env_var("YOUTUBE_API_KEY") or "",
+            service_account=get_env_var("GOOGLE_SHEETS_SERVICE_ACCOUNT_JSON") or "",
+        )
+
     def _parse_multiple_channels(self, channel_input: str) -> list[str]:
         """Parse multiple channels from text input or chips."""
         # Use chips if available, otherwise parse input
-        if hasattr(self, 'channel_chips') and self.channel_chips:
-            return self.channel_chips
+        if self.channel_chips:
+            return list(self.channel_chips)
         
-        import re
+        # A lone channel ID or @handle is already normalized
+        stripped = channel_input.strip()
+        if _CHANNEL_ID_RE.fullmatch(stripped) or _HANDLE_RE.fullmatch(stripped):
+            return [stripped]
         
         # Split by common delimiters: newlines, commas, spaces
-        tokens = re.split(r'[,\s\n]+', channel_input.strip())
+        tokens = _CHANNEL_SPLIT_RE.split(stripped)
         
+        # Duplicates are dropped as they are found, preserving order
         channels = []
+        seen = set()
         for token in tokens:
             if not token:
                 continue
             
             # Normalize channel input
             normalized = self._normalize_channel_input(token)
-            if normalized:
+            if normalized and normalized not in seen:
+                seen.add(normalized)
                 channels.append(normalized)
         
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(channels))
+        return channels
 
     def _normalize_channel_input(self, channel_input: str) -> str:
         """Normalize a single channel input to channel ID."""
-        import re
-        
         # Check for direct Channel ID (UC...)
-        uc_match = re.match(r'\bUC[\w-]{22}\b', channel_input, re.I)
+        uc_match = _CHANNEL_ID_RE.match(channel_input)
         if uc_match:
             return uc_match.group(0)
         
         # Check for YouTube URL and extract identifier
-        url_match = re.search(
-            r'(?:https?://)?(?:www\.)?youtube\.com/(?:channel/|c/|user/|@)([^/\s?]+)',
-            channel_input, re.I
-        )
+        url_match = _CHANNEL_URL_RE.search(channel_input)
         if url_match:
             identifier = url_match.group(1)
             # If it's a channel ID in the URL, use it directly
-            if re.match(r'\bUC[\w-]{22}\b', identifier, re.I):
+            if _CHANNEL_ID_RE.match(identifier):
                 return identifier
             else:
                 # Otherwise, it's a handle or custom URL, keep as is for later resolution
                 return f"@{identifier}" if not identifier.startswith('@') else identifier
         
         # Check for @handle
-        handle_match = re.match(r'@[\w\.\-]{3,}', channel_input)
+        handle_match = _HANDLE_RE.match(channel_input)
         if handle_match:
             return handle_match.group(0)
         
         # If none of the above, assume it's a raw channel ID or unhandled format
         return channel_input
 
-    def _build_run_config(self, channels: list[str], sheet_url: str, tab_name: str, config: SyncConfig):
-        """Build RunConfig from GUI inputs for optimized processing."""
-        import re
-        from src.domain.models import RunConfig, Filters, Destination
+    def _build_run_config(self, channels: list[str], sheet_url: str, tab_name: str, config: SyncConfig,
+                          keywords: list[str] | None = None):
+        """Build RunConfig from GUI inputs for optimized processing.
         
+        ``keywords`` is the already-split keyword filter; it is split from
+        ``config`` when not given.
+        """
         # Extract spreadsheet ID
-        sheet_id_match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheet_url)
+        sheet_id_match = _SHEET_ID_RE.search(sheet_url)
         if not sheet_id_match:
             raise ValidationError(f"Invalid spreadsheet URL: {sheet_url}")
         sheet_id = sheet_id_match.group(1)
         
         # Build filters from SyncConfig
         filters = Filters(
-            keywords=config.keyword_filter.split(',') if config.keyword_filter else [],
+            keywords=config.keywords() if keywords is None else keywords,
             keyword_mode=config.keyword_mode,
             min_duration=config.min_duration_seconds or 0,
             exclude_shorts=(config.min_duration_seconds or 0) >= 60,
@@ -1935,15 +2079,15 @@ class YouTube2SheetsGUI:
             destination=destination
         )
 
-    def _sync_worker(self, channels: list[str], config: SyncConfig) -> None:
+    def _sync_worker(self, inputs: _SyncInputs, channels: list[str], config: SyncConfig) -> None:
         """Worker thread for processing multiple channels with optimization."""
         try:
             # PRE-FLIGHT VALIDATION
             self._append_log("🔍 Running pre-flight validation...")
             
             # Get API keys
-            youtube_api_key = get_env_var("YOUTUBE_API_KEY")
-            service_account_file = get_env_var("GOOGLE_SHEETS_SERVICE_ACCOUNT_JSON")
+            youtube_api_key = inputs.youtube_key
+            service_account_file = inputs.service_account
             
             if not youtube_api_key:
                 raise ValidationError("YouTube API key not found")
@@ -1951,14 +2095,21 @@ class YouTube2SheetsGUI:
                 raise ValidationError("Service account file not found")
             
             # Get spreadsheet ID
-            sheet_id = self.current_spreadsheet_id
+            sheet_id = inputs.sheet_id
             if not sheet_id:
                 raise ValidationError("No spreadsheet selected")
             
-            # Get tab name
-            tab_name = self.tab_name_var.get().strip()
+            # The tab name was read for the selected mode; a new tab is only
+            # created once validation has passed
+            use_existing = inputs.use_existing
+            tab_name = inputs.tab_name
             if not tab_name:
-                raise ValidationError("Tab name is required")
+                raise ValidationError(
+                    "Tab name is required" if use_existing else "Please enter a name for the new tab"
+                )
+            
+            # Split the keyword filter once for validation and the run config
+            keywords = config.keywords()
             
             # Validate all inputs
             validator = SyncValidator(youtube_api_key, service_account_file)
@@ -1967,7 +2118,7 @@ class YouTube2SheetsGUI:
                 tab_name=tab_name,
                 channels=channels,
                 min_duration=config.min_duration_seconds,
-                keywords=config.keyword_filter.split(',') if config.keyword_filter else []
+                keywords=keywords
             )
             
             if errors:
@@ -1980,31 +2131,17 @@ class YouTube2SheetsGUI:
             # Build automator
             automator = self._build_automator()
             
-            # Get sheet configuration - use current spreadsheet from dropdown
-            if not self.current_spreadsheet_id:
-                raise ValidationError("Please select a spreadsheet from the dropdown")
-            
-            sheet_id = self.current_spreadsheet_id
-            
-            # Determine tab name based on mode
-            if self.use_existing_tab_var.get():
-                # Use existing tab
-                tab_name = self.tab_name_var.get().strip() or "YouTube Data"
+            if use_existing:
                 self._append_log(f"Using existing tab: {tab_name}")
             else:
-                # Create new tab
-                tab_name = self.new_tab_entry.get().strip()
-                if not tab_name:
-                    raise ValidationError("Please enter a name for the new tab")
                 self._append_log(f"Creating new tab: {tab_name}")
                 
                 # Create the new tab
+                sheets_service = None
                 try:
-                    sheets_config = SheetsConfig(
-                        service_account_file=self.config.get('google_sheets_service_account_json', ''),
-                        spreadsheet_id=sheet_id
+                    sheets_service = self._get_sheets_service(
+                        self.config.get('google_sheets_service_account_json', ''), sheet_id
                     )
-                    sheets_service = SheetsService(sheets_config)
                     
                     # Check if spreadsheet is at cell limit before attempting to create tab
                     if sheets_service.is_at_cell_limit():
@@ -2075,35 +2212,37 @@ class YouTube2SheetsGUI:
                         
                 except Exception as e:
                     raise ValidationError(f"Error creating new tab: {str(e)}")
+                finally:
+                    if sheets_service is not None:
+                        self._release_sheets_service(sheets_service)
 
             # ⭐ NEW: Build RunConfig for optimized processing
             # Convert sheet_id to full URL for _build_run_config
             sheet_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
-            run_config = self._build_run_config(channels, sheet_url, tab_name, config)
+            run_config = self._build_run_config(channels, sheet_url, tab_name, config, keywords=keywords)
             
             # ⭐ NEW: Use optimized parallel processing (auto-selects best strategy)
             use_parallel = len(channels) > 1  # Use parallel for multiple channels
             
             # Log comprehensive filter settings for debugging
-            self._append_log(f"")
-            self._append_log(f"📋 Filter Configuration:")
-            self._append_log(f"   Keywords: {run_config.filters.keywords if run_config.filters.keywords else 'None'}")
-            self._append_log(f"   Keyword Mode: {run_config.filters.keyword_mode}")
-            self._append_log(f"   Min Duration: {run_config.filters.min_duration}s")
-            self._append_log(f"   Exclude Shorts: {run_config.filters.exclude_shorts}")
-            self._append_log(f"   Max Results: {run_config.filters.max_results}")
-            self._append_log(f"")
-            
-            if use_parallel:
-                self._append_log(f"⚡ Parallel mode: processing {len(channels)} channels concurrently")
-            else:
-                self._append_log(f"Processing {len(channels)} channel(s)")
+            filters = run_config.filters
+            self._append_log_many([
+                "",
+                "📋 Filter Configuration:",
+                f"   Keywords: {filters.keywords if filters.keywords else 'None'}",
+                f"   Keyword Mode: {filters.keyword_mode}",
+                f"   Min Duration: {filters.min_duration}s",
+                f"   Exclude Shorts: {filters.exclude_shorts}",
+                f"   Max Results: {filters.max_results}",
+                "",
+                f"⚡ Parallel mode: processing {len(channels)} channels concurrently"
+                if use_parallel else f"Processing {len(channels)} channel(s)",
+            ])
             
             # Update progress to show starting
             self.root.after(0, lambda: self.progress_bar.set(0.1))
             
             # ⭐ Execute optimized sync
-            from src.domain.models import RunStatus
             result = automator.sync_channels_optimized(run_config, use_parallel=use_parallel)
             
             # Update progress to completion
@@ -2226,7 +2365,7 @@ class YouTube2SheetsGUI:
         # Safely convert min_duration to int
         min_duration = None
         try:
-            min_duration_str = self.min_duration_var.get().strip()
+            min_duration_str = self.min_duration_entry.get().strip()
             if min_duration_str:
                 min_duration = int(min_duration_str)
         except (ValueError, AttributeError):
@@ -2236,52 +2375,98 @@ class YouTube2SheetsGUI:
             min_duration_seconds=min_duration,
             max_duration_seconds=None,  # Not used in this UI
             keyword_filter=self._get_keyword_filter_value(),
-            keyword_mode=self.keyword_mode_var.get(),
+            keyword_mode=self.keyword_mode_dropdown.get(),
             max_videos=50,  # YouTube API maximum per request
         )
     
     def _get_keyword_filter_value(self) -> str | None:
         """Get keyword filter value, excluding placeholder text."""
-        value = self.keyword_filter_var.get().strip()
+        value = self.keyword_filter_entry.get().strip()
         # Exclude placeholder text
         if not value or value == "tutorial, how to, program, multiple words":
             return None
         return value
 
     def _append_log(self, message: str) -> None:
-        """SURGICAL FIX: Append message with incremental updates for performance."""
+        """Append a timestamped message; it reaches the widget on the next drain."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         
-        # Add to ring buffer in memory
+        # Add to ring buffer in memory (deque drops the oldest entry itself)
         self.log_lines.append(log_entry)
-        if len(self.log_lines) > self.MAX_LOG_LINES:
-            self.log_lines.pop(0)
         
-        # Only update GUI if log_text widget exists
-        if hasattr(self, 'log_text') and self.log_text:
-            # SURGICAL FIX: Incremental write in widget (no full re-render)
-            self.log_text.configure(state="normal")
-            self.log_text.insert("end", log_entry + "\n")
-            # Trim in widget if needed (drop top line)
-            if int(self.log_text.index('end-1c').split('.')[0]) > self.MAX_LOG_LINES:
-                self.log_text.delete("1.0", "2.0")
-            self.log_text.configure(state="disabled")
-        self.log_text.see("end")
+        # Queue for the Tk thread; safe to call from the sync worker too
+        self._log_queue.put(log_entry)
     
-    def _append_log_from_logger(self, message: str) -> None:
-        """Append log message from logging system (without timestamp)."""
+    def _append_log_many(self, messages: Iterable[str]) -> None:
+        """Append several messages under one timestamp as a single queued block."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        entries = [f"[{timestamp}] {message}" for message in messages]
+        self.log_lines.extend(entries)
+        self._log_queue.put("\n".join(entries))
+    
+    def _write_log_lines(self, lines: list[str]) -> None:
+        """Write a batch of log lines to the widget with one insert and one scroll."""
         # Only add if log_text exists
         if hasattr(self, 'log_text') and self.log_text:
             try:
+                text = "\n".join(lines) + "\n"
                 self.log_text.configure(state="normal")
-                self.log_text.insert("end", f"   {message}\n")
-                if int(self.log_text.index('end-1c').split('.')[0]) > self.MAX_LOG_LINES:
-                    self.log_text.delete("1.0", "2.0")
+                self.log_text.insert("end", text)
+                # Track the line count here rather than asking Tk for it on
+                # every batch; a batch may add several lines, so drop all
+                # overflow at once
+                self._log_widget_lines += text.count("\n")
+                overflow = self._log_widget_lines - self.MAX_LOG_LINES
+                if overflow > 0:
+                    self.log_text.delete("1.0", f"{overflow + 1}.0")
+                    self._log_widget_lines = self.MAX_LOG_LINES
                 self.log_text.configure(state="disabled")
                 self.log_text.see("end")
-            except:
+            except tk.TclError:
                 pass
+    
+    def _run_in_background(self, handler, fn, *args) -> None:
+        """Run ``fn(*args)`` on the background pool, then ``handler(future)`` on the Tk thread."""
+        self._handle_when_done(handler, self._bg.submit(fn, *args))
+
+    def _handle_when_done(self, handler, *futures) -> None:
+        """Queue ``handler(*futures)`` for the Tk thread once every future has finished."""
+        pending = [len(futures)]
+        lock = threading.Lock()
+        
+        def done(_future) -> None:
+            with lock:
+                pending[0] -= 1
+                last = pending[0] == 0
+            if last:
+                self._tk_calls.put(partial(handler, *futures))
+        
+        for future in futures:
+            future.add_done_callback(done)
+
+    def _drain_log_queue(self) -> None:
+        """Run finished background handlers, then flush queued log lines in one write."""
+        while True:
+            try:
+                call = self._tk_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                call()
+            except Exception:
+                logger.exception("Background result handler failed")
+        
+        get = self._log_queue.get_nowait
+        batch = []
+        try:
+            while len(batch) < self.LOG_DRAIN_BATCH:
+                batch.append(get())
+        except queue.Empty:
+            pass
+        if batch:
+            self._write_log_lines(batch)
+        self._log_drain_id = self.root.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
         
     def _toggle_debug_logging(self) -> None:
         """Toggle debug logging mode."""
@@ -2297,6 +2482,8 @@ class YouTube2SheetsGUI:
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
+        self.log_lines.clear()
+        self._log_widget_lines = 0
         self._append_log("Logs cleared")
         
     def _export_logs(self) -> None:
@@ -2339,6 +2526,12 @@ class YouTube2SheetsGUI:
         except Exception as e:
             print(f"[CLEANUP] Error during cleanup: {e}")
         finally:
+            # Drop queued API calls; a fetch already in flight finishes on its own
+            self._bg.shutdown(wait=False, cancel_futures=True)
+            # Stop draining logger output before the widgets go away
+            if getattr(self, '_log_drain_id', None):
+                self.root.after_cancel(self._log_drain_id)
+                self._log_drain_id = None
             # Destroy window
             self.root.destroy()
 
@@ -2358,7 +2551,7 @@ class YouTube2SheetsGUI:
         ctk.CTkLabel(
             form_header,
             text="➕ Create New Job",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=self.colors['text_1']
         ).pack(side="left")
         
@@ -2440,14 +2633,13 @@ class YouTube2SheetsGUI:
         ctk.CTkLabel(
             list_header,
             text="📋 Active Jobs",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=self.colors['text_1']
         ).pack(side="left")
         
         # Job list (placeholder)
         self.job_list_frame = ctk.CTkScrollableFrame(list_card, fg_color="transparent")
         # Apply EXTREME ROCKET scrolling to job list
-        from src.utils.browser_like_scrolling import BrowserLikeScrolling
         self.job_scroll_handler = BrowserLikeScrolling(self.job_list_frame, scroll_speed=200.0, smooth_factor=0.998)
         self.job_list_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
@@ -2524,7 +2716,7 @@ class YouTube2SheetsGUI:
         close_btn = ctk.CTkButton(
             actions_frame,
             text="❌ Close",
-            command=lambda: parent.master.destroy(),
+            command=self._hide_scheduler_window,
             width=100,
             height=40,
             font=self.fonts['button'],
@@ -2560,36 +2752,36 @@ class YouTube2SheetsGUI:
         # TODO: Implement actual scheduler execution
         messagebox.showinfo("Scheduler", "Scheduler execution completed!")
     
-    def _on_channel_textbox_click(self, event) -> None:
-        """Handle channel textbox click for placeholder behavior."""
-        if self.channel_placeholder_active:
-            self.channel_textbox.delete("1.0", "end")
-            self.channel_textbox.configure(text_color=self.colors['text_1'])
-            self.channel_placeholder_active = False
-    
-    def _on_channel_textbox_focus_in(self, event) -> None:
-        """Handle channel textbox focus in for placeholder behavior."""
-        if self.channel_placeholder_active:
-            self.channel_textbox.delete("1.0", "end")
-            self.channel_textbox.configure(text_color=self.colors['text_1'])
-            self.channel_placeholder_active = False
-    
-    def _on_channel_textbox_focus_out(self, event) -> None:
-        """Handle channel textbox focus out for placeholder behavior."""
-        content = self.channel_textbox.get("1.0", "end-1c").strip()
-        if not content:
-            self.channel_textbox.insert("1.0", self.channel_placeholder_text)
-            self.channel_textbox.configure(text_color=self.colors['muted'])
-            self.channel_placeholder_active = True
+    def _handle_channel_placeholder(self, event=None, focus_out: bool = False) -> None:
+        """Clear the channel placeholder on click/focus in; restore it on focus out if empty."""
+        if not focus_out:
+            # The active flag says whether the placeholder is showing, so
+            # click and focus in never need to read the textbox
+            if self.channel_placeholder_active:
+                self.channel_textbox.delete("1.0", "end")
+                self.channel_textbox.configure(text_color=self.colors['text_1'])
+                self.channel_placeholder_active = False
+        elif not self.channel_placeholder_active:
+            if not self.channel_textbox.get("1.0", "end-1c").strip():
+                self.channel_textbox.insert("1.0", self.channel_placeholder_text)
+                self.channel_textbox.configure(text_color=self.colors['muted'])
+                self.channel_placeholder_active = True
     
     def _on_channel_textbox_change(self, event) -> None:
-        """Handle channel textbox content change for placeholder behavior."""
+        """Recount channels once a typing or paste burst settles."""
+        if self._channel_parse_after is not None:
+            self.root.after_cancel(self._channel_parse_after)
+        self._channel_parse_after = self.root.after(150, self._recount_channels)
+    
+    def _recount_channels(self) -> None:
+        """Parse the channel textbox and update the channel count label."""
+        self._channel_parse_after = None
         if not self.channel_placeholder_active:
             content = self.channel_textbox.get("1.0", "end-1c").strip()
             if content:
                 # Count channels and update display
                 channels = self._parse_multiple_channels(content)
-                self.channel_count_label.configure(text=f"{len(channels)} channels")
+                self.channel_count_var.set(f"{len(channels)} channels")
     
     def _update_spreadsheet_dropdown(self) -> None:
         """Update the spreadsheet dropdown with loaded spreadsheets."""
@@ -2636,14 +2828,13 @@ class YouTube2SheetsGUI:
                 self._append_log("[WARN] No service account file configured")
                 return
             
-            sheets_config = SheetsConfig(
-                service_account_file=service_account_file,
-                spreadsheet_id=spreadsheet.id
-            )
-            temp_sheets_service = SheetsService(sheets_config)
+            sheets_service = self._get_sheets_service(service_account_file, spreadsheet.id)
             
             # Get tabs from new spreadsheet
-            tabs = temp_sheets_service.get_existing_tabs()
+            try:
+                tabs = sheets_service.get_existing_tabs()
+            finally:
+                self._release_sheets_service(sheets_service)
             
             # Filter out ranking tabs
             filtered_tabs = [tab for tab in tabs if "ranking" not in tab.lower()]
@@ -2805,12 +2996,11 @@ class YouTube2SheetsGUI:
 
 def launch() -> None:
     """Launch the exact image layout GUI."""
-    gui = YouTube2SheetsGUI()
+    gui = YouTube2SheetsGUI.instance()
     gui.run()
 
 
 if __name__ == "__main__":
-    import sys
     sys.excepthook = _handle_global_exception
     # Only launch if this file is run directly, not imported
     launch()
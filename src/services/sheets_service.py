@@ -3,6 +3,8 @@ Google Sheets Service
 Handles all Google Sheets API interactions
 Following @PolyChronos-Omega.md framework and @QualityMandate.md standards
 """
+import os
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from googleapiclient.discovery import build
@@ -11,6 +13,37 @@ from googleapiclient.errors import HttpError
 from src.domain.models import SheetsConfig
 
 
+_SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+
+def _key_file_mtime(service_account_file: str) -> Optional[float]:
+    """Return the key file's modification time, or None if it can't be read."""
+    try:
+        return os.path.getmtime(service_account_file)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _load_credentials(service_account_file: str, mtime: Optional[float] = None) -> Credentials:
+    """Load service account credentials once per version of a key file.
+    
+    Every SheetsService for the same key file shares one Credentials object,
+    so its access token is minted once and reused across services. The
+    file's mtime is part of the cache key, so a replaced or rotated key file
+    is read again instead of serving the old Credentials.
+    """
+    return Credentials.from_service_account_file(
+        service_account_file,
+        scopes=_SHEETS_SCOPES
+    )
+
+
+def clear_credentials_cache() -> None:
+    """Drop every cached Credentials object, e.g. after the key file setting changes."""
+    _load_credentials.cache_clear()
+
+
 class SheetsService:
     """Service for Google Sheets operations."""
     
@@ -23,11 +56,9 @@ class SheetsService:
     def _initialize_service(self):
         """Initialize the Google Sheets service."""
         try:
-            # Set up credentials
-            credentials = Credentials.from_service_account_file(
-                self.config.service_account_file,
-                scopes=['https://www.googleapis.com/auth/spreadsheets']
-            )
+            # Set up credentials (shared per key file)
+            key_file = self.config.service_account_file
+            credentials = _load_credentials(key_file, _key_file_mtime(key_file))
             
             # Build the service
             self.service = build('sheets', 'v4', credentials=credentials)
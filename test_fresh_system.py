@@ -59,10 +59,10 @@ def test_fresh_system():
             print("❌ use_existing_tab_var attribute missing")
             return False
         
-        if hasattr(gui, 'min_duration_var'):
-            print("✅ min_duration_var attribute exists")
+        if hasattr(gui, 'min_duration_entry'):
+            print("✅ min_duration_entry attribute exists")
         else:
-            print("❌ min_duration_var attribute missing")
+            print("❌ min_duration_entry attribute missing")
             return False
         
         # Check that old attributes don't exist
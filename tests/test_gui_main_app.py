@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+GUI Main App Helper Tests
+Covers main-window helpers that don't need a running Tk loop
+"""
+
+import logging
+import os
+import queue
+import threading
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("customtkinter")
+
+from src.gui import main_app
+from src.gui.main_app import GUILogHandler, YouTube2SheetsGUI, _AllowedLoggerFilter
+from src.backend.youtube2sheets import SyncConfig
+
+
+def _record(name, level=logging.INFO, msg="hello"):
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+class TestAllowedLoggerFilter:
+    """Test which loggers are mirrored into the activity log."""
+    
+    @pytest.mark.parametrize("name", [
+        "youtube_service",
+        "youtube_service.quota",
+        "sheets_service",
+        "src.services.automator",
+        "src.services.automator.batch",
+    ])
+    def test_allowed_loggers_and_children_pass(self, name):
+        """Test that allowed loggers and their children, dotted or not, pass."""
+        assert _AllowedLoggerFilter().filter(_record(name))
+    
+    @pytest.mark.parametrize("name", [
+        "src",
+        "src.services",
+        "src.services.sheets_service",
+        "youtube_service_extra",
+        "googleapiclient.discovery",
+    ])
+    def test_other_loggers_are_rejected(self, name):
+        """Test that parents, siblings and prefix look-alikes are rejected."""
+        assert not _AllowedLoggerFilter().filter(_record(name))
+
+
+class TestGUILogHandler:
+    """Test the display lines the handler queues."""
+    
+    @pytest.mark.parametrize("level", [logging.INFO, logging.WARNING, logging.ERROR])
+    def test_line_is_indented_bare_message(self, level):
+        """Test that lines carry no level tag, only the logger-line indent."""
+        handler = GUILogHandler(queue.SimpleQueue())
+        assert handler.prepare(_record("sheets_service", level, "Created tab")) == "   Created tab"
+    
+    def test_only_info_and_above_are_queued(self):
+        """Test that DEBUG records never reach the queue."""
+        log_queue = queue.SimpleQueue()
+        handler = GUILogHandler(log_queue)
+        source = logging.getLogger("sheets_service.gui_test")
+        source.setLevel(logging.DEBUG)
+        source.addHandler(handler)
+        try:
+            source.debug("noise")
+            source.info("kept")
+        finally:
+            source.removeHandler(handler)
+        
+        assert log_queue.get_nowait() == "   kept"
+        assert log_queue.empty()
+
+
+class TestSheetsServiceCache:
+    """Test SheetsService reuse across threads and invalidation."""
+    
+    @pytest.fixture
+    def gui(self):
+        gui = SimpleNamespace(_sheets_cache={}, _sheets_leases={}, _sheets_lock=threading.Lock(),
+                              _sheets_generation=0)
+        gui.get = partial(YouTube2SheetsGUI._get_sheets_service, gui)
+        gui.release = partial(YouTube2SheetsGUI._release_sheets_service, gui)
+        return gui
+    
+    @pytest.fixture
+    def key_file(self, tmp_path):
+        path = tmp_path / "key.json"
+        path.write_text("{}")
+        return str(path)
+    
+    @pytest.fixture(autouse=True)
+    def fake_service(self):
+        with patch.object(main_app, "SheetsService",
+                          side_effect=lambda config: Mock(service=object())) as factory:
+            yield factory
+    
+    def test_released_service_is_reused(self, gui, key_file):
+        """Test that a client given back is handed to the next caller."""
+        first = gui.get(key_file, "sheet")
+        gui.release(first)
+        assert gui.get(key_file, "sheet") is first
+    
+    def test_refresh_client_is_reused_by_another_thread(self, gui, key_file):
+        """Test that a client built on one thread (refresh) is reused on another (sync)."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            first = pool.submit(gui.get, key_file, "sheet").result()
+            pool.submit(gui.release, first).result()
+        
+        result = []
+        worker = threading.Thread(target=lambda: result.append(gui.get(key_file, "sheet")))
+        worker.start()
+        worker.join()
+        assert result == [first]
+    
+    def test_checked_out_service_is_not_shared(self, gui, key_file):
+        """Test that a client in use is never handed to a second caller."""
+        first = gui.get(key_file, "sheet")
+        second = gui.get(key_file, "sheet")
+        assert first is not second
+        
+        gui.release(first)
+        gui.release(second)
+        assert gui._sheets_cache == {(key_file, os.path.getmtime(key_file), "sheet"): first}
+        assert gui._sheets_leases == {}
+    
+    def test_settings_save_drops_cached_and_checked_out_services(self, gui, key_file):
+        """Test that a generation bump (saving settings) keeps no older client."""
+        cached = gui.get(key_file, "sheet")
+        gui.release(cached)
+        in_use = gui.get(key_file, "sheet")
+        
+        gui._sheets_cache.clear()
+        gui._sheets_generation += 1
+        gui.release(in_use)
+        
+        assert gui.get(key_file, "sheet") not in (cached, in_use)
+    
+    def test_replaced_key_file_builds_new_service(self, gui, key_file):
+        """Test that a key file with a new mtime gets a new client."""
+        first = gui.get(key_file, "sheet")
+        gui.release(first)
+        mtime = os.path.getmtime(key_file)
+        os.utime(key_file, (mtime + 10, mtime + 10))
+        assert gui.get(key_file, "sheet") is not first
+    
+    def test_failed_service_is_not_cached(self, gui, key_file, fake_service):
+        """Test that a client whose initialization failed is retried."""
+        fake_service.side_effect = lambda config: Mock(service=None)
+        first = gui.get(key_file, "sheet")
+        gui.release(first)
+        assert gui.get(key_file, "sheet") is not first
+
+
+class TestBackgroundHandoff:
+    """Test that background results are handled on the draining (Tk) thread."""
+    
+    def test_handler_runs_only_when_drained(self):
+        """Test that the done-callback only enqueues the handler."""
+        handled = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            gui = SimpleNamespace(_bg=pool, _tk_calls=queue.SimpleQueue())
+            gui._handle_when_done = partial(YouTube2SheetsGUI._handle_when_done, gui)
+            YouTube2SheetsGUI._run_in_background(gui, lambda f: handled.append(f.result()), pow, 2, 5)
+        
+        assert handled == []
+        gui._tk_calls.get_nowait()()
+        assert handled == [32]
+    
+    def test_drain_runs_handlers_and_flushes_log(self):
+        """Test that one drain tick runs queued handlers and writes their log lines."""
+        gui = SimpleNamespace(
+            _tk_calls=queue.SimpleQueue(),
+            _log_queue=queue.SimpleQueue(),
+            _write_log_lines=Mock(),
+            _drain_log_queue=Mock(),
+            root=Mock(),
+            LOG_DRAIN_BATCH=200,
+            LOG_DRAIN_INTERVAL_MS=50,
+        )
+        gui._tk_calls.put(lambda: gui._log_queue.put("fetched"))
+        
+        def failing():
+            raise RuntimeError("boom")
+        gui._tk_calls.put(failing)
+        
+        YouTube2SheetsGUI._drain_log_queue(gui)
+        
+        gui._write_log_lines.assert_called_once_with(["fetched"])
+        gui.root.after.assert_called_once_with(50, gui._drain_log_queue)
+    
+    def test_handler_waits_for_every_future(self):
+        """Test that a multi-future handler is queued once, after the last future finishes."""
+        gui = SimpleNamespace(_tk_calls=queue.SimpleQueue())
+        first, second = Future(), Future()
+        handled = []
+        YouTube2SheetsGUI._handle_when_done(gui, lambda *fs: handled.append([f.result() for f in fs]),
+                                            first, second)
+        
+        second.set_result("sheets")
+        assert gui._tk_calls.empty()
+        first.set_result("youtube")
+        gui._tk_calls.get_nowait()()
+        assert gui._tk_calls.empty()
+        assert handled == [["youtube", "sheets"]]
+    
+    def test_api_probes_log_youtube_first(self):
+        """Test that the key test runs both probes off-thread and logs YouTube's lines first."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            gui = SimpleNamespace(
+                _bg=pool,
+                _tk_calls=queue.SimpleQueue(),
+                youtube_api_key_var=Mock(get=Mock(return_value="key")),
+                service_account_path_var=Mock(get=Mock(return_value="")),
+                _append_log=Mock(),
+                _append_log_many=Mock(),
+                _probe_youtube=YouTube2SheetsGUI._probe_youtube,
+                _probe_sheets=YouTube2SheetsGUI._probe_sheets,
+            )
+            gui._handle_when_done = partial(YouTube2SheetsGUI._handle_when_done, gui)
+            gui._report_api_probes = partial(YouTube2SheetsGUI._report_api_probes, gui)
+            YouTube2SheetsGUI._test_api_keys(gui)
+        
+        gui._append_log.assert_called_once_with("Testing API keys...")
+        gui._append_log_many.assert_not_called()
+        gui._tk_calls.get_nowait()()
+        gui._append_log_many.assert_called_once_with([
+            *YouTube2SheetsGUI._probe_youtube("key"),
+            *YouTube2SheetsGUI._probe_sheets(""),
+        ])
+
+
+class TestFetchedTabs:
+    """Test that only the latest tab fetch updates the dropdown."""
+    
+    @pytest.fixture
+    def gui(self):
+        return SimpleNamespace(
+            _tabs_request=2,
+            refresh_tabs_btn=Mock(),
+            tab_name_dropdown=Mock(),
+            tab_name_var=Mock(),
+            _append_log=Mock(),
+            _append_log_many=Mock(),
+        )
+    
+    @staticmethod
+    def _done(tabs):
+        future = Future()
+        future.set_result(tabs)
+        return future
+    
+    def test_stale_fetch_is_dropped(self, gui):
+        """Test that a fetch finishing after a newer refresh started changes nothing."""
+        YouTube2SheetsGUI._apply_fetched_tabs(gui, 1, self._done(["Old"]))
+        
+        gui.tab_name_dropdown.configure.assert_not_called()
+        gui.tab_name_var.set.assert_not_called()
+        gui.refresh_tabs_btn.configure.assert_not_called()
+    
+    def test_current_fetch_updates_dropdown(self, gui):
+        """Test that the latest fetch fills the dropdown, minus 'Ranking' tabs."""
+        YouTube2SheetsGUI._apply_fetched_tabs(gui, 2, self._done(["New", "Ranking Q1"]))
+        
+        gui.tab_name_dropdown.configure.assert_called_once_with(values=["New"])
+        gui.tab_name_var.set.assert_called_once_with("New")
+        gui.refresh_tabs_btn.configure.assert_called_once_with(state="normal", text="🔄")
+
+
+class TestPastedChannels:
+    """Test the split-off-thread paste path."""
+    
+    def test_split_drops_blanks_and_duplicates_in_order(self):
+        """Test that pasted text is split once, keeping first occurrences."""
+        text = "@one, @two\n@one  UCabc\n\n"
+        assert YouTube2SheetsGUI._split_pasted_channels(text) == ["@one", "@two", "UCabc"]
+    
+    def test_insert_skips_chips_added_during_split(self):
+        """Test that channels chipped while the split ran are not added twice."""
+        gui = SimpleNamespace(channel_chips={"@two": ()}, _add_channel_chip=Mock())
+        future = Future()
+        future.set_result(["@one", "@two"])
+        
+        YouTube2SheetsGUI._insert_pasted_channels(gui, future)
+        
+        gui._add_channel_chip.assert_called_once_with("@one")
+
+
+class TestRunConfigKeywords:
+    """Test keyword splitting for the run config."""
+    
+    SHEET_URL = "https://docs.google.com/spreadsheets/d/abc123/edit"
+    
+    @pytest.mark.parametrize("keyword_filter, expected", [
+        ("data, analytics", ["data", "analytics"]),
+        (" a, ,b ,", ["a", "b"]),
+        ("", []),
+        (None, []),
+    ])
+    def test_keywords_are_stripped_and_empties_dropped(self, keyword_filter, expected):
+        """Test that SyncConfig.keywords() strips entries and drops blanks."""
+        assert SyncConfig(keyword_filter=keyword_filter).keywords() == expected
+    
+    def test_run_config_splits_filter_when_not_given(self):
+        """Test that the run config falls back to SyncConfig.keywords()."""
+        config = SyncConfig(keyword_filter="data, analytics")
+        run_config = YouTube2SheetsGUI._build_run_config(None, ["@chan"], self.SHEET_URL, "Tab", config)
+        assert run_config.filters.keywords == ["data", "analytics"]
+        assert run_config.destination.spreadsheet_id == "abc123"
+    
+    def test_run_config_uses_given_keywords(self):
+        """Test that already-split keywords are used as given."""
+        config = SyncConfig(keyword_filter="ignored")
+        run_config = YouTube2SheetsGUI._build_run_config(
+            None, ["@chan"], self.SHEET_URL, "Tab", config, keywords=["kept"]
+        )
+        assert run_config.filters.keywords == ["kept"]
+
+
+class TestSaveSettings:
+    """Test the settings dialog's save path."""
+    
+    @pytest.fixture
+    def gui(self):
+        return SimpleNamespace(
+            youtube_api_key_var=Mock(get=Mock(return_value=" yt-key-1234 ")),
+            service_account_path_var=Mock(get=Mock(return_value="/keys/sa.json")),
+            sheet_url_var=Mock(get=Mock(return_value="https://docs.google.com/spreadsheets/d/abc123/edit")),
+            config={"youtube_api_key": "old"},
+            _sheets_cache={("old.json", None, "sheet"): Mock()},
+            _sheets_lock=threading.Lock(),
+            _sheets_generation=0,
+            _append_log=Mock(),
+            _append_log_many=Mock(),
+            _hide_settings_dialog=Mock(),
+            _refresh_tabs=Mock(),
+        )
+    
+    def test_save_passes_values_positionally_and_updates_config(self, gui):
+        """Test that save_config gets (key, service account, url) and the config is updated in place."""
+        with patch.object(main_app, "save_config") as save_config, \
+                patch.object(main_app, "clear_credentials_cache") as clear_cache, \
+                patch.object(main_app, "messagebox") as messagebox:
+            YouTube2SheetsGUI._save_settings(gui)
+        
+        save_config.assert_called_once_with(
+            "yt-key-1234", "/keys/sa.json", "https://docs.google.com/spreadsheets/d/abc123/edit"
+        )
+        messagebox.showerror.assert_not_called()
+        clear_cache.assert_called_once_with()
+        assert gui.config == {
+            "youtube_api_key": "yt-key-1234",
+            "google_sheets_service_account_json": "/keys/sa.json",
+            "default_spreadsheet_url": "https://docs.google.com/spreadsheets/d/abc123/edit",
+        }
+        assert gui._sheets_generation == 1
+        assert gui._sheets_cache == {}
+        gui._refresh_tabs.assert_called_once_with()
+    
+    def test_missing_key_is_not_saved(self, gui):
+        """Test that a blank API key shows a validation error and saves nothing."""
+        gui.youtube_api_key_var.get.return_value = "  "
+        with patch.object(main_app, "save_config") as save_config, \
+                patch.object(main_app, "messagebox") as messagebox:
+            YouTube2SheetsGUI._save_settings(gui)
+        
+        save_config.assert_not_called()
+        messagebox.showerror.assert_called_once()
+        assert gui._sheets_generation == 0
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Modern Theme Style Cache Test
+Ensures cached style dicts are per theme and can't be corrupted by callers
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+ctk = pytest.importorskip("customtkinter")
+
+from src.gui.components.modern_theme import ModernTheme
+
+
+@pytest.fixture
+def fonts():
+    """CTkFont stand-in, so no Tk root is needed."""
+    with patch.object(ctk, "CTkFont", side_effect=lambda **kwargs: Mock()) as factory:
+        yield factory
+
+
+class TestModernThemeStyles:
+    """Test memoized style getters."""
+    
+    def test_styles_are_built_once(self, fonts):
+        """Test that repeated lookups reuse the built fonts."""
+        theme = ModernTheme()
+        first = theme.get_button_style("primary")
+        second = theme.get_button_style("primary")
+        assert first["font"] is second["font"]
+        assert fonts.call_count == 6
+    
+    def test_caller_mutation_does_not_leak(self, fonts):
+        """Test that updating a returned style doesn't change later results."""
+        theme = ModernTheme()
+        style = theme.get_input_style()
+        style.update(height=99)
+        assert theme.get_input_style()["height"] == 44
+    
+    def test_namespaces_return_copies(self, fonts):
+        """Test that attribute-style namespaces don't share mutable dicts."""
+        theme = ModernTheme()
+        theme.text.body["text_color"] = "#123456"
+        assert theme.text.body["text_color"] == theme.colors.text_primary
+    
+    def test_namespace_lookup_builds_each_kind_once(self, fonts):
+        """Test that namespaces are built once and one lookup doesn't build the other kinds."""
+        theme = ModernTheme()
+        assert theme.button is theme.button
+        theme.button.success
+        theme.button.ghost
+        assert fonts.call_count == 6
+        assert theme.button.ghost == theme.get_button_style("ghost")
+    
+    def test_namespace_rejects_unknown_variant(self, fonts):
+        """Test that an unknown variant is an AttributeError, not a fallback style."""
+        with pytest.raises(AttributeError):
+            ModernTheme().text.headline
+    
+    def test_namespace_follows_theme_toggle(self, fonts):
+        """Test that namespace lookups return the colors of the current theme."""
+        theme = ModernTheme()
+        theme.toggle_theme()
+        assert theme.text.body["text_color"] == theme.colors.text_primary
+    
+    def test_toggle_theme_rebuilds_styles(self, fonts):
+        """Test that toggling the theme returns styles in the new colors."""
+        theme = ModernTheme()
+        dark = theme.get_input_style()
+        theme.toggle_theme()
+        light = theme.get_input_style()
+        assert dark["fg_color"] != light["fg_color"]
+        assert light["fg_color"] == theme.colors.surface
+    
+    def test_separate_instances_have_separate_caches(self, fonts):
+        """Test that one theme's cache doesn't serve another's lookups."""
+        first, second = ModernTheme(), ModernTheme()
+        second.colors.primary = "#000001"
+        assert first.get_button_style()["fg_color"] != second.get_button_style()["fg_color"]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+GUI Performance Optimizer Test
+Covers the animator's property writes and the monitor's sampling loop
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("customtkinter")
+
+from src.gui.components.performance_optimizer import AsyncTaskManager, PerformanceMonitor, SmoothAnimator
+
+
+class FakeWidget:
+    """Widget with a fixed set of configure() options and plain attributes."""
+    
+    OPTIONS = ("width", "height")
+    
+    def __init__(self):
+        self.configured = {}
+        self.alpha = 0.0
+    
+    def cget(self, name):
+        if name not in self.OPTIONS:
+            raise ValueError(f"unknown option {name!r}")
+        return self.configured.get(name)
+    
+    def configure(self, **values):
+        for name, value in values.items():
+            if name not in self.OPTIONS or not isinstance(value, (int, float)):
+                raise ValueError(f"bad option {name}={value!r}")
+        self.configured.update(values)
+
+
+class TestSmoothAnimatorWrites:
+    """Test how animated values reach the widget."""
+    
+    @pytest.fixture
+    def animator(self):
+        return SmoothAnimator(Mock())
+    
+    def test_options_and_attributes_are_written_separately(self, animator):
+        """Test that a non-option property doesn't break the widget's option writes."""
+        widget = FakeWidget()
+        animator.animate_property(widget, "width", 0, 10, duration=0.01)
+        animator.animate_property(widget, "alpha", 0.0, 1.0, duration=0.01)
+        animator._t0[:] = [t - 1.0 for t in animator._t0]
+        
+        animator._animation_loop()
+        
+        assert widget.configured["width"] == 10
+        assert widget.alpha == 1.0
+        assert animator._ids == []
+    
+    def test_rejected_value_does_not_drop_other_writes(self, animator):
+        """Test that the batched configure falls back per key."""
+        widget = FakeWidget()
+        animator._apply(widget, {"width": 5, "height": "tall"})
+        assert widget.configured == {"width": 5}
+
+
+class TestPerformanceMonitor:
+    """Test the monitor's sampling cadence."""
+    
+    def test_default_wakeup_is_not_per_frame(self):
+        """Test that the monitor doesn't wake at 60 Hz by default."""
+        assert PerformanceMonitor(Mock())._monitor_interval >= 0.1
+    
+    def test_thresholds_are_rate_limited_without_psutil(self):
+        """Test that threshold checks follow system_metrics_hz even without psutil."""
+        monitor = PerformanceMonitor(Mock(), polling_interval=0.005, system_metrics_hz=2.0)
+        monitor._proc = None
+        with patch.object(monitor, "_check_performance_thresholds") as check:
+            monitor.start_monitoring()
+            time.sleep(0.2)
+            monitor.stop_monitoring()
+        assert check.call_count == 1
+    
+    def test_sampling_error_does_not_stop_monitor(self):
+        """Test that a failing sample is reported and the loop keeps running."""
+        monitor = PerformanceMonitor(Mock(), polling_interval=0.005, system_metrics_hz=100.0)
+        with patch.object(monitor, "_update_metrics", side_effect=RuntimeError("boom")) as update:
+            monitor.start_monitoring()
+            time.sleep(0.1)
+            alive = monitor.monitor_thread.is_alive()
+            monitor.stop_monitoring()
+        assert alive
+        assert update.call_count > 1
+    
+    @pytest.mark.parametrize("hz", [0, -1.0])
+    def test_non_positive_metrics_rate_is_rejected(self, hz):
+        """Test that a metrics rate of zero or less is a ValueError, not a ZeroDivisionError."""
+        with pytest.raises(ValueError):
+            PerformanceMonitor(Mock(), system_metrics_hz=hz)
+    
+    def test_frame_ticks_measure_frame_rate(self):
+        """Test that Tk-thread ticks turn frame gaps into a frame rate and reschedule."""
+        root = Mock()
+        monitor = PerformanceMonitor(root)
+        monitor.is_monitoring = True
+        monitor._last_frame_ts = 10.0
+        with patch.object(time, "monotonic", side_effect=[10.05, 10.10]):
+            monitor._frame_tick()
+            monitor._frame_tick()
+        assert monitor.metrics.frame_rate == pytest.approx(20.0)
+        assert root.after.call_count == 2
+    
+    def test_slow_frames_trigger_optimization(self):
+        """Test that a measured frame rate below min_fps is acted on."""
+        monitor = PerformanceMonitor(Mock())
+        monitor.metrics.frame_rate = monitor.min_fps / 2
+        with patch.object(monitor, "_optimize_performance") as optimize:
+            monitor._check_performance_thresholds()
+        optimize.assert_called_once_with()
+    
+    def test_stop_cancels_frame_tick(self):
+        """Test that stopping the monitor cancels the pending frame tick."""
+        root = Mock()
+        monitor = PerformanceMonitor(root)
+        monitor.start_monitoring()
+        monitor.stop_monitoring()
+        root.after_cancel.assert_called_once_with(root.after.return_value)
+    
+    def test_unmeasured_frame_rate_does_not_trigger_optimization(self):
+        """Test that the default 0.0 frame rate isn't treated as a slow UI."""
+        monitor = PerformanceMonitor(Mock())
+        with patch.object(monitor, "_optimize_performance") as optimize:
+            monitor._check_performance_thresholds()
+        optimize.assert_not_called()
+
+
+class TestAsyncTaskManager:
+    """Test task manager startup and completion."""
+    
+    def test_construction_spawns_no_threads(self):
+        """Test that creating the manager doesn't block on starting workers."""
+        before = threading.active_count()
+        manager = AsyncTaskManager(max_workers=8)
+        try:
+            assert threading.active_count() == before
+        finally:
+            manager.shutdown()
+    
+    def test_callback_receives_result(self):
+        """Test that workers start on demand and report results."""
+        manager = AsyncTaskManager(max_workers=2)
+        results = []
+        try:
+            manager.submit_task("job", pow, 2, 3, callback=results.append).result(timeout=1)
+        finally:
+            manager.shutdown()
+        assert results == [8]
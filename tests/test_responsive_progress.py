@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Responsive Progress Bar Test
+Ensures a fresh bar redraws when reset instead of staying at its initial value
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+ctk = pytest.importorskip("customtkinter")
+
+from src.gui.components import responsive_progress
+from src.gui.components.responsive_progress import ResponsiveProgressBar
+
+
+@pytest.fixture
+def animator():
+    """Shared animator stand-in, so no Tk event loop is needed."""
+    fake = Mock()
+    with patch.object(responsive_progress._GlobalAnimator, "get", return_value=fake):
+        yield fake
+
+
+@pytest.fixture
+def bar():
+    """Fresh bar whose CTkProgressBar base shows its default initial value of 0.5."""
+    with patch.object(ctk.CTkProgressBar, "__init__", lambda self, master, **kwargs: None), \
+         patch.object(ctk.CTkProgressBar, "get", return_value=0.5), \
+         patch.object(ctk.CTkProgressBar, "bind"), \
+         patch.object(ctk.CTkProgressBar, "set") as drawn:
+        progress = ResponsiveProgressBar(None)
+        progress.drawn = drawn
+        yield progress
+
+
+class TestResponsiveProgressBar:
+    """Test set_progress/reset on a bar that hasn't been driven yet."""
+    
+    def test_fresh_bar_tracks_initial_value(self, bar):
+        """Test that animation state starts from the value already drawn."""
+        assert bar._target_value == 0.5
+        assert bar._current_value == 0.5
+    
+    def test_reset_without_animation_draws_zero(self, bar):
+        """Test that reset() on a fresh bar actually draws 0."""
+        bar.reset(animate=False)
+        bar.drawn.assert_called_once_with(0.0)
+    
+    def test_set_progress_zero_draws_zero(self, bar):
+        """Test that set_progress(0.0) is not skipped on a fresh bar."""
+        bar.set_progress(0.0, animate=False)
+        bar.drawn.assert_called_once_with(0.0)
+    
+    def test_animated_reset_starts_animation(self, bar, animator):
+        """Test that an animated reset (as LiveProgressTracker.start uses) animates."""
+        bar.reset(animate=True)
+        assert bar._is_animating
+        animator.register.assert_called_once_with(bar)
+    
+    def test_set_progress_to_shown_value_is_skipped(self, bar, animator):
+        """Test that setting the value already shown does no work."""
+        bar.set_progress(0.5, animate=True)
+        bar.drawn.assert_not_called()
+        animator.register.assert_not_called()
+    
+    def test_animation_finishes_on_target(self, bar, animator):
+        """Test that the final frame draws the target value."""
+        bar.set_progress(1.0, animate=True)
+        bar._start_time -= bar.animation_duration
+        assert bar._animate_progress() is False
+        bar.drawn.assert_called_with(1.0)
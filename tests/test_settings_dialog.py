@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Settings Dialog Reuse Test
+Ensures a reshown settings dialog doesn't keep cancelled edits
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+ctk = pytest.importorskip("customtkinter")
+
+from src.gui.components.settings_dialog import ModernSettingsDialog
+
+
+@pytest.fixture
+def dialog():
+    """Reused dialog stand-in with one entry and one checkbox."""
+    return SimpleNamespace(
+        widgets={
+            "youtube_api_key": Mock(spec=ctk.CTkEntry),
+            "enable_animations": Mock(spec=ctk.CTkCheckBox),
+        },
+        _saved_values={},
+        _build_pending_sections=Mock(),
+        _set_widget_value=ModernSettingsDialog._set_widget_value,
+        theme_var=Mock(),
+    )
+
+
+class TestSettingsDialogRestore:
+    """Test that reshowing the dialog discards unsaved edits."""
+    
+    def test_never_saved_fields_are_cleared(self, dialog):
+        """Test that a dialog never saved returns to its empty state."""
+        ModernSettingsDialog._restore_saved_values(dialog)
+        
+        entry = dialog.widgets["youtube_api_key"]
+        entry.delete.assert_called_once_with(0, "end")
+        entry.insert.assert_not_called()
+        dialog.widgets["enable_animations"].deselect.assert_called_once_with()
+    
+    def test_saved_values_are_shown_again(self, dialog):
+        """Test that the last saved values replace cancelled edits."""
+        dialog._saved_values = {"youtube_api_key": "saved-key", "enable_animations": 1}
+        
+        ModernSettingsDialog._restore_saved_values(dialog)
+        
+        entry = dialog.widgets["youtube_api_key"]
+        entry.delete.assert_called_once_with(0, "end")
+        entry.insert.assert_called_once_with(0, "saved-key")
+        dialog.widgets["enable_animations"].select.assert_called_once_with()
+    
+    def test_deferred_sections_are_built_first(self, dialog):
+        """Test that every setting widget exists before values are restored."""
+        ModernSettingsDialog._restore_saved_values(dialog)
+        dialog._build_pending_sections.assert_called_once_with()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Sheets Credentials Cache Test
+Ensures a replaced service-account key file is not served from the cache
+"""
+
+import os
+import pytest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.services import sheets_service
+from src.services.sheets_service import _key_file_mtime, _load_credentials
+
+
+class TestCredentialsCache:
+    """Test that cached Credentials follow the key file on disk."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _load_credentials.cache_clear()
+        yield
+        _load_credentials.cache_clear()
+    
+    def test_same_key_file_reuses_credentials(self, tmp_path):
+        """Test that an unchanged key file is loaded once."""
+        key_file = tmp_path / "key.json"
+        key_file.write_text("{}")
+        
+        with patch.object(sheets_service.Credentials, "from_service_account_file",
+                          side_effect=lambda *a, **kw: Mock()) as loader:
+            first = _load_credentials(str(key_file), _key_file_mtime(str(key_file)))
+            second = _load_credentials(str(key_file), _key_file_mtime(str(key_file)))
+        
+        assert first is second
+        assert loader.call_count == 1
+    
+    def test_replaced_key_file_is_reloaded(self, tmp_path):
+        """Test that a key file with a new mtime gets fresh Credentials."""
+        key_file = tmp_path / "key.json"
+        key_file.write_text("{}")
+        
+        with patch.object(sheets_service.Credentials, "from_service_account_file",
+                          side_effect=lambda *a, **kw: Mock()) as loader:
+            first = _load_credentials(str(key_file), _key_file_mtime(str(key_file)))
+            
+            # Simulate the key being rotated on disk
+            mtime = os.path.getmtime(key_file)
+            os.utime(key_file, (mtime + 10, mtime + 10))
+            second = _load_credentials(str(key_file), _key_file_mtime(str(key_file)))
+        
+        assert first is not second
+        assert loader.call_count == 2
+    
+    def test_missing_key_file_has_no_mtime(self, tmp_path):
+        """Test that an unreadable key file maps to a None mtime."""
+        assert _key_file_mtime(str(tmp_path / "missing.json")) is None
+    
+    def test_clear_credentials_cache_forces_reload(self, tmp_path):
+        """Test that clearing the cache (as saving settings does) reloads the key file."""
+        key_file = tmp_path / "key.json"
+        key_file.write_text("{}")
+        mtime = _key_file_mtime(str(key_file))
+        
+        with patch.object(sheets_service.Credentials, "from_service_account_file",
+                          side_effect=lambda *a, **kw: Mock()) as loader:
+            first = _load_credentials(str(key_file), mtime)
+            sheets_service.clear_credentials_cache()
+            second = _load_credentials(str(key_file), mtime)
+        
+        assert first is not second
+        assert loader.call_count == 2